@@ -1,3 +1,28 @@
+from backend.trie import letters_mask
+
+
+
+# Flat neighbor tables indexed by cell id (row * cols + col), built once per
+# board shape and shared by every Board of that shape.
+_NEIGHBOR_TABLES: dict[tuple[int, int], tuple[tuple[int, ...], ...]] = {}
+
+def neighbor_table(rows: int, cols: int) -> tuple[tuple[int, ...], ...]:
+    table = _NEIGHBOR_TABLES.get((rows, cols))
+    if table is None:
+        directions = [
+            (-1, -1), (-1, 0), (-1, 1), (0, -1), (0, 1), (1, -1), (1, 0), (1, 1)
+        ]
+        table = tuple(
+            tuple(
+                (row + dr) * cols + (col + dc)
+                for dr, dc in directions
+                if 0 <= row + dr < rows and 0 <= col + dc < cols
+            )
+            for row in range(rows)
+            for col in range(cols)
+        )
+        _NEIGHBOR_TABLES[(rows, cols)] = table
+    return table
 
 
 class Board:
@@ -26,6 +51,9 @@ class Board:
         self.rows = rows
         self.cols = cols
         self.grid = [[grid_string[i * cols + j] for j in range(cols)] for i in range(rows)]
+        self.letters = list(grid_string)
+        self.letter_mask = letters_mask(grid_string)
+        self.neighbors = neighbor_table(rows, cols)
     
     def get_letter(self, row: int, col: int) -> str:
         if 0 <= row < self.rows and 0 <= col < self.cols:
@@ -33,17 +61,10 @@ class Board:
         return None
     
     def get_neighbors(self, row: int, col: int) -> list:
-        neighbors = []
-        directions = [
-            (-1, -1), (-1, 0), (-1, 1), (0, -1), (0, 1), (1, -1), (1, 0), (1, 1)
-        ]
-        
-        for dr, dc in directions:
-            new_row, new_col = row + dr, col + dc
-            if 0 <= new_row < self.rows and 0 <= new_col < self.cols:
-                neighbors.append((new_row, new_col))
-        
-        return neighbors
+        return [divmod(cell, self.cols) for cell in self.neighbors[row * self.cols + col]]
+    
+    def cell_id(self, row: int, col: int) -> int:
+        return row * self.cols + col
     
     def get_all_positions(self) -> list:
         return [(i, j) for i in range(self.rows) for j in range(self.cols)]
@@ -0,0 +1,93 @@
+import io
+from typing import Iterable
+
+from backend.leaderboard import INSERT_COLUMNS, LENGTH_COLUMNS, LENGTH_SCORE_SUMS, ensure_schema
+
+# Batches with at least this many word rows go through COPY instead of a
+# multi-row INSERT.
+COPY_MIN_ROWS = 500
+
+_UPDATE_LENGTH_SCORES = ", ".join(f"{column} = EXCLUDED.{column}"
+                                  for column in [*LENGTH_COLUMNS.values(), "total_score"])
+
+_COPY_ESCAPES = str.maketrans({"\\": "\\\\", "\t": "\\t", "\n": "\\n", "\r": "\\r"})
+
+
+# Rows in COPY's text format: tab-separated, one per line, \N for NULL.
+def copy_buffer(rows: Iterable[tuple]) -> io.StringIO:
+    buffer = io.StringIO()
+    for row in rows:
+        buffer.write("\t".join("\\N" if value is None else str(value).translate(_COPY_ESCAPES)
+                               for value in row))
+        buffer.write("\n")
+    buffer.seek(0)
+    return buffer
+
+
+# Streams rows into a temporary copy of table with COPY FROM STDIN, then
+# merges them with INSERT ... SELECT so rows that already exist (by the
+# table's unique constraint) are skipped just like ON CONFLICT DO NOTHING.
+# The session-local staging table is created on first use and emptied after
+# every merge. Returns the number of rows actually inserted.
+def copy_rows(cur, table: str, columns: tuple[str, ...], rows: Iterable[tuple]) -> int:
+    staging = f"{table}_staging"
+    column_list = ", ".join(columns)
+    cur.execute(f'''
+    CREATE TEMP TABLE IF NOT EXISTS {staging}
+        (LIKE {table} INCLUDING DEFAULTS) ON COMMIT DELETE ROWS;
+    ''')
+    cur.copy_expert(f"COPY {staging} ({column_list}) FROM STDIN", copy_buffer(rows))
+    cur.execute(f'''
+    INSERT INTO {table} ({column_list})
+    SELECT {column_list} FROM {staging}
+    ON CONFLICT DO NOTHING;
+    ''')
+    inserted = cur.rowcount
+    cur.execute(f"TRUNCATE {staging};")
+    return inserted
+
+
+# Recomputes board_values and board_length_scores for boards from their
+# board_words rows, so a board whose words arrived in several chunks ends up
+# with the totals of all of them.
+def refresh_board_totals(cur, boards: list[str]) -> None:
+    cur.execute('''
+    INSERT INTO board_values (board, value)
+    SELECT board, SUM(value) FROM board_words WHERE board = ANY(%s) GROUP BY board
+    ON CONFLICT (board) DO UPDATE SET value = EXCLUDED.value;
+    ''', (boards,))
+    cur.execute(f'''
+    INSERT INTO board_length_scores ({INSERT_COLUMNS})
+    SELECT board, {LENGTH_SCORE_SUMS} FROM board_words WHERE board = ANY(%s) GROUP BY board
+    ON CONFLICT (board) DO UPDATE SET {_UPDATE_LENGTH_SCORES};
+    ''', (boards,))
+
+
+# For backfill and import jobs: copies an arbitrarily long stream of
+# (board, word, value) rows into board_words, committing every chunk_rows rows
+# so neither the buffer nor the transaction grows with the input. Each chunk's
+# boards get their board_values and board_length_scores rows in the same
+# transaction, so they show up on the leaderboard and in percentiles.
+def ingest_words(pool, rows: Iterable[tuple[str, str, int]], chunk_rows: int = 100_000) -> int:
+    inserted = 0
+    chunk = []
+    with pool.connection() as conn:
+        ensure_schema(conn)
+        cur = conn.cursor()
+        for row in rows:
+            chunk.append(row)
+            if len(chunk) >= chunk_rows:
+                inserted += _ingest_chunk(cur, chunk)
+                conn.commit()
+                chunk = []
+        if chunk:
+            inserted += _ingest_chunk(cur, chunk)
+            conn.commit()
+        cur.close()
+    return inserted
+
+
+def _ingest_chunk(cur, chunk: list[tuple[str, str, int]]) -> int:
+    inserted = copy_rows(cur, "board_words", ("board", "word", "value"), chunk)
+    refresh_board_totals(cur, sorted({board for board, _, _ in chunk}))
+    return inserted
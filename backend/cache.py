@@ -0,0 +1,107 @@
+import threading
+from collections import OrderedDict
+from typing import Callable
+
+from backend.board import Board
+
+# Cell permutations for every rotation/reflection of a board shape. Square
+# boards have the 8 dihedral symmetries; other shapes only keep the 4 that
+# preserve rows x cols.
+_SYMMETRIES: dict[tuple[int, int], list[tuple[int, ...]]] = {}
+
+
+def board_symmetries(rows: int, cols: int) -> list[tuple[int, ...]]:
+    symmetries = _SYMMETRIES.get((rows, cols))
+    if symmetries is None:
+        transforms = [
+            lambda r, c: (r, c),
+            lambda r, c: (r, cols - 1 - c),
+            lambda r, c: (rows - 1 - r, c),
+            lambda r, c: (rows - 1 - r, cols - 1 - c),
+        ]
+        if rows == cols:
+            transforms += [
+                lambda r, c: (c, r),
+                lambda r, c: (c, rows - 1 - r),
+                lambda r, c: (cols - 1 - c, r),
+                lambda r, c: (cols - 1 - c, rows - 1 - r),
+            ]
+        symmetries = []
+        for transform in transforms:
+            sources = (transform(r, c) for r in range(rows) for c in range(cols))
+            permutation = tuple(src_r * cols + src_c for src_r, src_c in sources)
+            if permutation not in symmetries:
+                symmetries.append(permutation)
+        _SYMMETRIES[(rows, cols)] = symmetries
+    return symmetries
+
+
+def canonical_board(board: Board) -> str:
+    letters = board.letters
+    return min(
+        "".join([letters[i] for i in permutation])
+        for permutation in board_symmetries(board.rows, board.cols)
+    )
+
+
+# Bounded LRU in front of a solve function such as Solver.solve. Rotated or
+# mirrored boards share an entry because they contain exactly the same words.
+class SolveCache:
+
+    def __init__(self, solve: Callable[[Board], list[tuple[str, int]]], maxsize: int = 1024):
+        if maxsize < 1:
+            raise ValueError("maxsize must be at least 1")
+        self._solve = solve
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries: OrderedDict[str, list[tuple[str, int]]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def solve(self, board: Board) -> list[tuple[str, int]]:
+        results = self.lookup(board)
+        if results is None:
+            results = self._solve(board)
+            self.store(board, results)
+        return list(results)
+
+    # lookup/store split solve() in two for callers that decide per result
+    # whether it may be cached. A lookup counts as a hit or a miss.
+    def lookup(self, board: Board) -> list[tuple[str, int]] | None:
+        key = self._key(board)
+        with self._lock:
+            results = self._entries.get(key)
+            if results is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return list(results)
+
+    def store(self, board: Board, results: list[tuple[str, int]]) -> None:
+        key = self._key(board)
+        with self._lock:
+            self._entries[key] = list(results)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "size": len(self._entries),
+                "maxsize": self.maxsize,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+            }
+
+    def _key(self, board: Board) -> str:
+        return f"{board.rows}x{board.cols}:{canonical_board(board)}"
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = self.evictions = 0
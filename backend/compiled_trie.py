@@ -0,0 +1,163 @@
+import mmap
+import struct
+import sys
+from array import array
+from collections import deque
+
+from backend.trie import NO_WORDS_BELOW, TrieMap, letter_bit, letters_mask
+
+# File layout (all integers little-endian):
+#   header        MAGIC, version, node_count, edge_count, word_count
+#   edge_start    uint32[node_count + 1]  node i owns edges edge_start[i]..edge_start[i + 1]
+#   letter_masks  uint32[node_count]      letters every word below the node needs
+#   child_masks   uint32[node_count]      bit per a-z letter the node has an edge for
+#   flags         uint8[node_count]       bit 0 set when the node ends a word
+#   min_depth     uint8[node_count]       fewest letters needed to finish a word below
+#   max_depth     uint8[node_count]       most letters needed to finish a word below
+#   edge_letters  uint8[edge_count]       per node: a-z in order, then any other characters
+# Nodes are numbered breadth-first so the root is always node 0, and edge e
+# leads to node e + 1. A node's a-z edges come first, so the child for letter bit b is edge_start[node] + popcount(child_mask & (b - 1)) + 1,
+# which child() computes without searching the edge letters.
+MAGIC = b"WHTR"
+FORMAT_VERSION = 3
+HEADER = struct.Struct("<4sIIII")
+HEADER_SIZE = 32
+
+_LETTER_BYTES = {chr(i): bytes([i]) for i in range(128)}
+_LETTER_BITS = {char: letter_bit(char) for char in "abcdefghijklmnopqrstuvwxyz"}
+
+
+def compile_dictionary(source: str | TrieMap, output_path: str, min_length: int = 3) -> None:
+    if isinstance(source, TrieMap):
+        trie = source
+    else:
+        trie = TrieMap()
+        trie.load_from_file(source, min_length)
+
+    edge_start = array("I", [0])
+    letter_masks = array("I")
+    child_masks = array("I")
+    flags = bytearray()
+    min_depth = bytearray()
+    max_depth = bytearray()
+    edge_letters = bytearray()
+
+    queue = deque([trie.root])
+    while queue:
+        node = queue.popleft()
+        flags.append(1 if node.is_word else 0)
+        letter_masks.append(node.letter_mask)
+        child_masks.append(letters_mask(node.children))
+        min_depth.append(min(node.min_depth, NO_WORDS_BELOW))
+        max_depth.append(min(node.max_depth, NO_WORDS_BELOW))
+        for char in sorted(node.children, key=lambda char: (not letter_bit(char), char)):
+            edge_letters.append(ord(char))
+            queue.append(node.children[char])
+        edge_start.append(len(edge_letters))
+
+    if sys.byteorder != "little":
+        for table in (edge_start, letter_masks, child_masks):
+            table.byteswap()
+
+    with open(output_path, "wb") as f:
+        f.write(HEADER.pack(MAGIC, FORMAT_VERSION, len(flags), len(edge_letters), trie.size))
+        f.write(b"\0" * (HEADER_SIZE - HEADER.size))
+        for table in (edge_start, letter_masks, child_masks, flags, min_depth, max_depth, edge_letters):
+            f.write(table)
+
+
+class CompiledTrie:
+    def __init__(self, filepath: str):
+        with open(filepath, "rb") as f:
+            self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, version, node_count, edge_count, word_count = HEADER.unpack_from(self._mm, 0)
+        if magic != MAGIC or version != FORMAT_VERSION:
+            raise ValueError(f"{filepath} is not a compiled dictionary (version {FORMAT_VERSION})")
+
+        self.root = 0
+        self.size = word_count
+        self.node_count = node_count
+        self.edge_count = edge_count
+
+        offset = HEADER_SIZE
+        self._view = view = memoryview(self._mm)
+        self._edge_start, offset = self._uint32_table(view, offset, node_count + 1)
+        self._letter_masks, offset = self._uint32_table(view, offset, node_count)
+        self._child_masks, offset = self._uint32_table(view, offset, node_count)
+        self._flags = view[offset:offset + node_count]
+        self._min_depth = view[offset + node_count:offset + 2 * node_count]
+        self._max_depth = view[offset + 2 * node_count:offset + 3 * node_count]
+        self._letters_offset = offset + 3 * node_count
+
+    # uint32 tables are read in place on little-endian hosts and copied
+    # (byte-swapped) elsewhere.
+    def _uint32_table(self, view: memoryview, offset: int, count: int) -> tuple:
+        end = offset + 4 * count
+        if sys.byteorder == "little":
+            return view[offset:end].cast("I"), end
+        table = array("I", view[offset:end])
+        table.byteswap()
+        return table, end
+
+    def search(self, word: str) -> bool:
+        node = self._find_node(word)
+        return node is not None and self.is_terminal(node)
+
+    def starts_with(self, prefix: str) -> bool:
+        return self._find_node(prefix) is not None
+
+    def _find_node(self, prefix: str) -> int | None:
+        node = self.root
+        for char in prefix:
+            node = self.child(node, char)
+            if node is None:
+                return None
+        return node
+
+    def child(self, node: int, char: str) -> int | None:
+        bit = _LETTER_BITS.get(char)
+        if bit is None:
+            return self._other_child(node, char)
+        mask = self._child_masks[node]
+        if not mask & bit:
+            return None
+        return self._edge_start[node] + (mask & (bit - 1)).bit_count() + 1
+
+    # Edges for characters outside a-z (only possible in tries built with
+    # insert() directly) are found by searching the node's edge letters.
+    def _other_child(self, node: int, char: str) -> int | None:
+        letter = _LETTER_BYTES.get(char)
+        if letter is None:
+            return None
+        base = self._letters_offset
+        index = self._mm.find(letter, base + self._edge_start[node], base + self._edge_start[node + 1])
+        if index < 0:
+            return None
+        return index - base + 1
+
+    def is_terminal(self, node: int) -> bool:
+        return self._flags[node] & 1 == 1
+
+    def can_extend(self, node: int, missing_letters: int, free_cells: int) -> bool:
+        return self._min_depth[node] <= free_cells and not self._letter_masks[node] & missing_letters
+
+    def max_depth(self, node: int) -> int:
+        return self._max_depth[node]
+
+    def close(self) -> None:
+        for table in (self._edge_start, self._letter_masks, self._child_masks,
+                      self._flags, self._min_depth, self._max_depth):
+            if isinstance(table, memoryview):
+                table.release()
+        self._view.release()
+        self._mm.close()
+
+
+if __name__ == "__main__":
+    source = sys.argv[1] if len(sys.argv) > 1 else "backend/dictionary.txt"
+    output = sys.argv[2] if len(sys.argv) > 2 else "backend/dictionary.bin"
+    compile_dictionary(source, output)
+    compiled = CompiledTrie(output)
+    print(f"Compiled {compiled.size} words into {compiled.node_count} nodes -> {output}")
+    compiled.close()
@@ -0,0 +1,112 @@
+import os
+import threading
+import time
+from contextlib import contextmanager
+from typing import Callable, Iterator
+
+import psycopg2
+
+DB_SETTINGS = {
+    "host": os.environ.get("WORDHUNT_DB_HOST", "wordhunt-db.ch8ues0g2yx6.us-east-2.rds.amazonaws.com"),
+    "database": os.environ.get("WORDHUNT_DB_NAME", "postgres"),
+    "user": os.environ.get("WORDHUNT_DB_USER", "wwang038"),
+    "password": os.environ.get("WORDHUNT_DB_PASSWORD", "Password0988"),
+    "port": int(os.environ.get("WORDHUNT_DB_PORT", "5432")),
+}
+
+
+class PoolTimeout(Exception):
+    pass
+
+
+# Process-level pool of Postgres connections. Nothing is opened until the
+# first checkout, idle connections are pinged before reuse once they have sat
+# longer than health_check_interval, and a connection that fails (or was
+# closed by the server) is dropped so the next checkout reconnects. Work that
+# was not committed inside the with block is rolled back on checkin.
+class ConnectionPool:
+
+    def __init__(self, connect: Callable[[], object] | None = None, max_connections: int = 5,
+                 health_check_interval: float = 30.0, checkout_timeout: float = 10.0):
+        self._connect = connect or (lambda: psycopg2.connect(**DB_SETTINGS))
+        self.max_connections = max_connections
+        self.health_check_interval = health_check_interval
+        self.checkout_timeout = checkout_timeout
+        self.opened = 0
+        self._idle: list[tuple[object, float]] = []
+        self._slots = threading.BoundedSemaphore(max_connections)
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def connection(self) -> Iterator[object]:
+        if not self._slots.acquire(timeout=self.checkout_timeout):
+            raise PoolTimeout(f"No database connection free after {self.checkout_timeout}s")
+        try:
+            conn = self._checkout()
+        except BaseException:
+            self._slots.release()
+            raise
+
+        try:
+            yield conn
+        except (psycopg2.OperationalError, psycopg2.InterfaceError):
+            self._discard(conn)
+            raise
+        except BaseException:
+            self._release(conn)
+            raise
+        else:
+            self._release(conn)
+
+    def close(self) -> None:
+        with self._lock:
+            idle, self._idle = self._idle, []
+        for conn, _ in idle:
+            self._discard(conn, release_slot=False)
+
+    def _checkout(self) -> object:
+        while True:
+            with self._lock:
+                if not self._idle:
+                    break
+                conn, last_used = self._idle.pop()
+            if conn.closed:
+                self._discard(conn, release_slot=False)
+            elif time.monotonic() - last_used < self.health_check_interval or self._is_healthy(conn):
+                return conn
+            else:
+                self._discard(conn, release_slot=False)
+
+        conn = self._connect()
+        self.opened += 1
+        return conn
+
+    def _is_healthy(self, conn) -> bool:
+        try:
+            with conn.cursor() as cur:
+                cur.execute("SELECT 1")
+                cur.fetchone()
+            conn.rollback()
+            return True
+        except psycopg2.Error:
+            return False
+
+    def _release(self, conn) -> None:
+        try:
+            if conn.closed:
+                raise psycopg2.InterfaceError("connection already closed")
+            conn.rollback()
+        except psycopg2.Error:
+            self._discard(conn)
+            return
+        with self._lock:
+            self._idle.append((conn, time.monotonic()))
+        self._slots.release()
+
+    def _discard(self, conn, release_slot: bool = True) -> None:
+        try:
+            conn.close()
+        except psycopg2.Error:
+            pass
+        if release_slot:
+            self._slots.release()
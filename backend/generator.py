@@ -0,0 +1,55 @@
+import random
+from typing import Iterator
+
+# English letter frequencies (percent)
+LETTER_WEIGHTS = {
+    "e": 12.7, "t": 9.1, "a": 8.2, "o": 7.5, "i": 7.0, "n": 6.7, "s": 6.3, "h": 6.1,
+    "r": 6.0, "d": 4.3, "l": 4.0, "c": 2.8, "u": 2.8, "m": 2.4, "w": 2.4, "f": 2.2,
+    "g": 2.0, "y": 2.0, "p": 1.9, "b": 1.5, "v": 1.0, "k": 0.8, "j": 0.2, "x": 0.2,
+    "q": 0.1, "z": 0.1,
+}
+
+# The sixteen dice of 4x4 Boggle and the twenty-five of 5x5 Big Boggle. Cells
+# hold one letter here, so the "Qu" face is a plain q.
+BOGGLE_DICE = (
+    "aaeegn", "abbjoo", "achops", "affkps", "aoottw", "cimotu", "deilrx", "delrvy",
+    "distty", "eeghnw", "eeinsu", "ehrtvw", "eiosst", "elrtty", "himnuq", "hlnnrz",
+)
+BIG_BOGGLE_DICE = (
+    "aaafrs", "aaeeee", "aafirs", "adennn", "aeeeem", "aeegmu", "aegmnn", "afirsy",
+    "bjkqxz", "ccenst", "ceiilt", "ceilpt", "ceipst", "ddhnot", "dhhlor", "dhlnor",
+    "dhlnor", "eiiitt", "emottt", "ensssu", "fiprsy", "gorrvw", "iprrry", "nootuw",
+    "ooottu",
+)
+# 6x6 sets use multi-letter and blank faces, so the 6x6 cup is Big Boggle's
+# dice plus the first eleven 4x4 dice.
+DICE = {
+    4: BOGGLE_DICE,
+    5: BIG_BOGGLE_DICE,
+    6: BIG_BOGGLE_DICE + BOGGLE_DICE[:11],
+}
+GENERATOR_MODES = ("frequency", "dice")
+
+
+# One size x size grid string. "frequency" draws every cell independently
+# from LETTER_WEIGHTS; "dice" shuffles the board size's dice into the cells
+# and rolls each one.
+def random_grid(size: int, rng: random.Random, mode: str = "frequency") -> str:
+    if mode == "frequency":
+        letters, weights = zip(*LETTER_WEIGHTS.items())
+        return "".join(rng.choices(letters, weights, k=size * size))
+    if mode == "dice":
+        if size not in DICE:
+            raise ValueError(f"No dice for {size}x{size} boards; dice exist for sizes {sorted(DICE)}")
+        dice = list(DICE[size])
+        rng.shuffle(dice)
+        return "".join(rng.choice(die) for die in dice)
+    raise ValueError(f"Unknown generator mode {mode!r}, expected one of {GENERATOR_MODES}")
+
+
+# count grids from a generator seeded with seed, so the same arguments always
+# give the same boards.
+def generate_grids(size: int, count: int, seed: int = 0, mode: str = "frequency") -> Iterator[str]:
+    rng = random.Random(seed)
+    for _ in range(count):
+        yield random_grid(size, rng, mode)
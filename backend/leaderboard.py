@@ -0,0 +1,121 @@
+from typing import NamedTuple
+
+LEADERBOARD_LENGTHS = range(3, 17)
+LENGTH_COLUMNS = {length: f"score_{length}" for length in LEADERBOARD_LENGTHS}
+PAGE_SIZE = 20
+MAX_PAGES = 10
+
+# One row per board holding its score split by word length, so any subset of
+# lengths can be ranked without touching board_words. The index serves the
+# unfiltered leaderboard (every length selected) straight from total_score.
+SCHEMA = f'''
+CREATE TABLE IF NOT EXISTS board_length_scores (
+    board TEXT PRIMARY KEY,
+    {", ".join(f"{column} INTEGER NOT NULL DEFAULT 0" for column in LENGTH_COLUMNS.values())},
+    total_score INTEGER NOT NULL DEFAULT 0
+);
+CREATE INDEX IF NOT EXISTS board_length_scores_total_idx
+    ON board_length_scores (total_score DESC, board);
+'''
+
+INSERT_COLUMNS = f"board, {', '.join(LENGTH_COLUMNS.values())}, total_score"
+
+# The columns after board in INSERT_COLUMNS, aggregated over a board's
+# board_words rows. total_score counts only LEADERBOARD_LENGTHS, like
+# length_scores_row().
+LENGTH_SCORE_SUMS = ", ".join(
+    [f"COALESCE(SUM(value) FILTER (WHERE LENGTH(word) = {length}), 0)" for length in LENGTH_COLUMNS]
+    + [f"COALESCE(SUM(value) FILTER (WHERE LENGTH(word) BETWEEN {LEADERBOARD_LENGTHS.start}"
+       f" AND {LEADERBOARD_LENGTHS.stop - 1}), 0)"])
+
+# Rebuilds missing rows from board_words; run once after creating the table.
+BACKFILL = f'''
+INSERT INTO board_length_scores ({INSERT_COLUMNS})
+SELECT board, {LENGTH_SCORE_SUMS}
+FROM board_words
+GROUP BY board
+ON CONFLICT (board) DO NOTHING;
+'''
+
+
+class LeaderboardPage(NamedTuple):
+    records: list[tuple[str, int]]
+    total_records: int
+    # True when more boards match than the MAX_PAGES pages counted
+    more_records: bool = False
+
+
+# Creates and backfills the table the first time; a no-op once it exists.
+def ensure_schema(conn) -> None:
+    cur = conn.cursor()
+    cur.execute("SELECT to_regclass('board_length_scores');")
+    if cur.fetchone()[0] is None:
+        cur.execute(SCHEMA)
+        cur.execute(BACKFILL)
+        conn.commit()
+    cur.close()
+
+
+# The board_length_scores row for a solved board, in INSERT_COLUMNS order.
+def length_scores_row(board: str, results: list[tuple[str, int]]) -> tuple:
+    scores = dict.fromkeys(LENGTH_COLUMNS, 0)
+    for word, value in results:
+        if len(word) in scores:
+            scores[len(word)] += value
+    return (board, *scores.values(), sum(scores.values()))
+
+
+# Column names come from LENGTH_COLUMNS only, never from the request, so the
+# expression is safe to splice into the query.
+def _score_expression(lengths: list[int]) -> str:
+    if set(lengths) >= set(LENGTH_COLUMNS):
+        return "total_score"
+    return " + ".join(LENGTH_COLUMNS[length] for length in sorted(set(lengths)))
+
+
+# Keyset pagination: rows are ordered by (score DESC, board ASC) and a page
+# starts strictly after the (score, board) of the previous page's last row,
+# or, going backwards, strictly before the first row of the following page.
+# The total is counted only up to MAX_PAGES pages, which is all the UI shows;
+# one row past that is counted to tell whether there are more.
+def leaderboard_page(cur, lengths: list[int], after: tuple[int, str] | None = None,
+                     before: tuple[int, str] | None = None,
+                     page_size: int = PAGE_SIZE) -> LeaderboardPage:
+    score = _score_expression(lengths)
+    params: list = []
+    where = f"{score} > 0"
+    if after is not None:
+        where += f" AND ({score} < %s OR ({score} = %s AND board > %s))"
+        params += [after[0], after[0], after[1]]
+        order = f"{score} DESC, board ASC"
+    elif before is not None:
+        where += f" AND ({score} > %s OR ({score} = %s AND board < %s))"
+        params += [before[0], before[0], before[1]]
+        order = f"{score} ASC, board DESC"
+    else:
+        order = f"{score} DESC, board ASC"
+
+    cur.execute(f'''
+    SELECT board, {score} FROM board_length_scores
+    WHERE {where}
+    ORDER BY {order}
+    LIMIT %s;
+    ''', (*params, page_size))
+    records = [tuple(row) for row in cur.fetchall()]
+    if before is not None:
+        records.reverse()
+
+    cur.execute(f'''
+    SELECT COUNT(*) FROM (
+        SELECT 1 FROM board_length_scores WHERE {score} > 0 LIMIT %s
+    ) AS capped;
+    ''', (page_size * MAX_PAGES + 1,))
+    counted = cur.fetchone()[0]
+    return LeaderboardPage(records, min(counted, page_size * MAX_PAGES), counted > page_size * MAX_PAGES)
+
+
+if __name__ == "__main__":
+    from backend.database import ConnectionPool
+
+    with ConnectionPool().connection() as conn:
+        ensure_schema(conn)
@@ -0,0 +1,169 @@
+import argparse
+import json
+import math
+import os
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import NamedTuple
+
+from backend.board import Board
+from backend.generator import LETTER_WEIGHTS, random_grid
+from backend.solver import Solver, get_dictionary
+
+MUTATION_RATE = 0.3
+# Workers parse the plain word list even where WORDHUNT_DICTIONARY points at
+# the compiled trie: TrieMap lookups are faster (benchmarks/bench_optimizer.py),
+# and the parse is paid once per worker, not once per board.
+WORD_LIST_PATH = "backend/dictionary.txt"
+
+
+class AnnealResult(NamedTuple):
+    grid: str
+    score: int
+    evaluations: int
+    # evaluations that needed a search; the rest were boards seen before
+    solves: int
+
+
+def board_score(solver: Solver, grid: str) -> int:
+    return solver.score(Board(grid)).total_score
+
+
+# Simulated annealing over one board. Each step either swaps two cells or,
+# with probability MUTATION_RATE, replaces one cell with a letter drawn from
+# LETTER_WEIGHTS; a worse board is accepted with probability exp(delta / T),
+# where T cools geometrically from start_temperature to end_temperature.
+def anneal(solver: Solver, size: int, steps: int, seed: int, start_grid: str | None = None,
+           start_temperature: float = 2000.0, end_temperature: float = 25.0) -> AnnealResult:
+    rng = random.Random(seed)
+    letters, weights = zip(*LETTER_WEIGHTS.items())
+    # A chain keeps stepping back onto boards it has scored (rejected moves
+    # are retried, swaps of equal letters change nothing), so scores are
+    # remembered for the length of the chain.
+    scores: dict[str, int] = {}
+
+    def evaluate(grid: str) -> int:
+        score = scores.get(grid)
+        if score is None:
+            score = scores[grid] = board_score(solver, grid)
+        return score
+
+    current = list(start_grid or random_grid(size, rng))
+    current_score = evaluate("".join(current))
+    best, best_score = "".join(current), current_score
+    cooling = (end_temperature / start_temperature) ** (1 / max(steps - 1, 1))
+    temperature = start_temperature
+
+    for _ in range(steps):
+        candidate = current.copy()
+        if rng.random() < MUTATION_RATE:
+            candidate[rng.randrange(len(candidate))] = rng.choices(letters, weights)[0]
+        else:
+            i, j = rng.sample(range(len(candidate)), 2)
+            candidate[i], candidate[j] = candidate[j], candidate[i]
+        candidate_score = evaluate("".join(candidate))
+
+        delta = candidate_score - current_score
+        if delta >= 0 or rng.random() < math.exp(delta / temperature):
+            current, current_score = candidate, candidate_score
+            if current_score > best_score:
+                best, best_score = "".join(current), current_score
+        temperature *= cooling
+
+    return AnnealResult(best, best_score, steps + 1, len(scores))
+
+
+# Pool workers score with the iterative engine and no prefilter, since a
+# single board never pays back building a board trie.
+_worker_solver: Solver | None = None
+
+
+def _init_worker(dictionary_path: str | None) -> None:
+    global _worker_solver
+    _worker_solver = Solver(get_dictionary(dictionary_path or WORD_LIST_PATH), engine="iterative", prefilter="off")
+
+
+def _anneal_task(size: int, steps: int, seed: int, start_grid: str | None) -> AnnealResult:
+    return anneal(_worker_solver, size, steps, seed, start_grid)
+
+
+def load_checkpoint(path: str) -> dict[str, int]:
+    if not os.path.exists(path):
+        return {}
+    with open(path) as f:
+        return {entry["grid"]: entry["score"] for entry in json.load(f)["boards"]}
+
+
+# Written to a temporary file and renamed over the old checkpoint, so an
+# interrupted run never leaves a truncated file behind.
+def save_checkpoint(path: str, boards: dict[str, int], keep: int) -> None:
+    best = sorted(boards.items(), key=lambda item: (-item[1], item[0]))[:keep]
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w") as f:
+        json.dump({"boards": [{"grid": grid, "score": score} for grid, score in best]}, f, indent=1)
+    os.replace(tmp_path, path)
+
+
+# Runs independent annealing chains across a process pool. Chains start from
+# random boards, or from the best checkpointed boards of the same size when
+# a checkpoint exists, and the checkpoint is rewritten as each chain finishes.
+def optimize(size: int = 4, runs: int = 8, steps: int = 2000, seed: int = 0,
+             workers: int | None = None, checkpoint_path: str | None = None, keep: int = 50,
+             dictionary_path: str | None = None) -> dict[str, int]:
+    best = load_checkpoint(checkpoint_path) if checkpoint_path else {}
+    starts = [grid for grid, _ in sorted(best.items(), key=lambda item: -item[1]) if len(grid) == size * size]
+    evaluations = solves = 0
+    started = time.perf_counter()
+
+    with ProcessPoolExecutor(max_workers=workers or os.cpu_count() or 1, initializer=_init_worker,
+                             initargs=(dictionary_path,)) as executor:
+        futures = [executor.submit(_anneal_task, size, steps, seed * 1_000_003 + run,
+                                   starts[run] if run < len(starts) else None)
+                   for run in range(runs)]
+        for future in as_completed(futures):
+            result = future.result()
+            evaluations += result.evaluations
+            solves += result.solves
+            best[result.grid] = result.score
+            if checkpoint_path:
+                save_checkpoint(checkpoint_path, best, keep)
+            elapsed = time.perf_counter() - started
+            print(f"{result.grid} {result.score:>7}  "
+                  f"({evaluations} evaluations, {evaluations / elapsed:,.0f} evaluations/s; "
+                  f"{solves} solves, {solves / elapsed:,.0f} solves/s)")
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Search for high-scoring boards by simulated annealing.")
+    parser.add_argument("--size", type=int, default=4)
+    parser.add_argument("--runs", type=int, default=8, help="independent annealing chains")
+    parser.add_argument("--steps", type=int, default=2000, help="boards evaluated per chain")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--checkpoint", default="best_boards.json")
+    parser.add_argument("--keep", type=int, default=50, help="boards kept in the checkpoint")
+    parser.add_argument("--store", action="store_true",
+                        help="record the best boards through the configured storage (WORDHUNT_STORAGE)")
+    args = parser.parse_args()
+
+    best = optimize(args.size, args.runs, args.steps, args.seed, args.workers, args.checkpoint, args.keep)
+    if args.store:
+        from backend.storage import open_storage
+        from backend.writer import Submission
+
+        solver = Solver(get_dictionary())
+        top = sorted(best.items(), key=lambda item: -item[1])[:args.keep]
+        batch = []
+        for grid, _ in top:
+            results = solver.solve(Board(grid))
+            batch.append(Submission(grid, sum(score for _, score in results), results))
+        storage = open_storage()
+        storage.record_submissions(batch)
+        storage.close()
+        print(f"Stored {len(batch)} boards")
+
+
+if __name__ == "__main__":
+    main()
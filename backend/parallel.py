@@ -0,0 +1,82 @@
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+
+from backend.board import Board
+from backend.solver import Solver, _DeadlineExceeded, get_dictionary
+
+# Each pool worker keeps one Solver bound to the process-wide dictionary.
+# With the default fork start method the parent's already-loaded trie (or the
+# shared mmap of a compiled one) is inherited, so workers never reload it.
+_worker_solver: Solver | None = None
+
+
+def _init_worker(dictionary_path: str | None, engine: str) -> None:
+    global _worker_solver
+    _worker_solver = Solver(get_dictionary(dictionary_path), engine)
+
+
+# Returns the words found, how many of the cells were searched completely and
+# whether the deadline (a time.monotonic() value, which is system-wide) cut
+# the search short.
+def _solve_cells(grid: str, rows: int, cols: int, min_length: int, cells: list[int],
+                 deadline: float | None = None) -> tuple[set[str], int, bool]:
+    board = Board(grid, rows, cols)
+    _worker_solver._begin(min_length=min_length, deadline=deadline)
+    covered = 0
+    try:
+        for cell in cells:
+            if deadline is not None and time.monotonic() >= deadline:
+                raise _DeadlineExceeded
+            _worker_solver._search_cell(board, cell)
+            covered += 1
+    except _DeadlineExceeded:
+        return _worker_solver.found_words, covered, True
+    return _worker_solver.found_words, covered, False
+
+
+class ParallelSolver(Solver):
+
+    def __init__(self, dictionary_path: str | None = None, workers: int | None = None,
+                 engine: str = "recursive"):
+        super().__init__(get_dictionary(dictionary_path), engine)
+        self.workers = workers or os.cpu_count() or 1
+        self._executor = ProcessPoolExecutor(
+            max_workers=self.workers,
+            initializer=_init_worker,
+            initargs=(dictionary_path, engine),
+        )
+
+    # Start cells are dealt round-robin so every worker gets a mix of corner,
+    # edge and interior cells; the per-worker word sets are merged here.
+    # Workers prune by min_length; top_k is applied to the merged result since
+    # no single worker sees every word. deadline_ms bounds every worker's
+    # search and sets partial and cells_covered as in Solver.solve.
+    def solve(self, board: Board, top_k: int | None = None, min_length: int = 3,
+              deadline_ms: float | None = None) -> list[tuple[str, int]]:
+        self.found_words.clear()
+        self.partial = False
+        self.cells_covered = 0
+        deadline = None if deadline_ms is None else time.monotonic() + deadline_ms / 1000
+
+        cells = range(len(board.letters))
+        partitions = [list(cells[i::self.workers]) for i in range(min(self.workers, len(cells)))]
+        grid = "".join(board.letters)
+        for words, covered, partial in self._executor.map(_solve_cells, repeat(grid), repeat(board.rows),
+                                                          repeat(board.cols), repeat(min_length), partitions,
+                                                          repeat(deadline)):
+            self.found_words.update(words)
+            self.cells_covered += covered
+            self.partial = self.partial or partial
+
+        return self._rank_words(self.found_words)[:top_k]
+
+    def close(self) -> None:
+        self._executor.shutdown()
+
+    def __enter__(self) -> "ParallelSolver":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
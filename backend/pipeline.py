@@ -0,0 +1,131 @@
+import argparse
+import gzip
+import json
+import os
+import sys
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, Iterator, TextIO
+
+from backend.board import Board
+from backend.generator import GENERATOR_MODES, generate_grids
+from backend.solver import Solver, get_dictionary
+from backend.writer import Submission
+
+# Boards generated and solved per pool task, and so per storage batch
+CHUNK_BOARDS = 250
+PROGRESS_SECONDS = 5.0
+
+# As in backend/parallel.py, each pool worker keeps one Solver bound to the
+# process-wide dictionary.
+_worker_solver: Solver | None = None
+
+
+def _init_worker(dictionary_path: str | None) -> None:
+    global _worker_solver
+    _worker_solver = Solver(get_dictionary(dictionary_path), engine="iterative")
+
+
+def _solve_chunk(size: int, count: int, seed: int, mode: str) -> list[Submission]:
+    batch = []
+    for grid in generate_grids(size, count, seed, mode):
+        results = _worker_solver.solve(Board(grid))
+        batch.append(Submission(grid, sum(score for _, score in results), results))
+    return batch
+
+
+# Chunk i of a run is generated from its own seed, so the boards depend only
+# on (seed, chunk_boards) and not on how many workers solved them.
+def chunk_seed(seed: int, chunk: int) -> int:
+    return seed * 1_000_003 + chunk
+
+
+# Generates count boards and solves them across a process pool, yielding
+# solved chunks in order. At most two chunks per worker are in flight, so
+# memory stays flat however many boards are requested.
+def solve_boards(size: int, count: int, seed: int = 0, mode: str = "frequency",
+                 workers: int | None = None, chunk_boards: int = CHUNK_BOARDS,
+                 dictionary_path: str | None = None) -> Iterator[list[Submission]]:
+    workers = workers or os.cpu_count() or 1
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                             initargs=(dictionary_path,)) as executor:
+        in_flight = deque()
+        for chunk, start in enumerate(range(0, count, chunk_boards)):
+            if len(in_flight) >= 2 * workers:
+                yield in_flight.popleft().result()
+            in_flight.append(executor.submit(_solve_chunk, size, min(chunk_boards, count - start),
+                                             chunk_seed(seed, chunk), mode))
+        while in_flight:
+            yield in_flight.popleft().result()
+
+
+# One JSON object per board, in the shape /api/solve/batch returns.
+def write_ndjson(out: TextIO, batch: list[Submission]) -> None:
+    for submission in batch:
+        out.write(json.dumps({
+            "grid": submission.board,
+            "total_score": submission.total_score,
+            "words": submission.results,
+        }))
+        out.write("\n")
+
+
+# Feeds every solved chunk to write and reports progress on stderr every
+# progress_seconds. Returns the number of boards and words written.
+def run_pipeline(batches: Iterator[list[Submission]], write: Callable[[list[Submission]], None],
+                 count: int, progress_seconds: float = PROGRESS_SECONDS) -> tuple[int, int]:
+    boards = words = 0
+    started = last_report = time.perf_counter()
+    for batch in batches:
+        write(batch)
+        boards += len(batch)
+        words += sum(len(submission.results) for submission in batch)
+        now = time.perf_counter()
+        if now - last_report >= progress_seconds or boards == count:
+            last_report = now
+            rate = boards / (now - started)
+            print(f"{boards:,}/{count:,} boards  {rate:,.0f} boards/s  "
+                  f"{words / (now - started):,.0f} words/s  ETA {(count - boards) / rate:,.0f}s",
+                  file=sys.stderr)
+    return boards, words
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Generate random boards, solve them on every core "
+                                                 "and load the results in bulk.")
+    parser.add_argument("--size", type=int, default=4)
+    parser.add_argument("--count", type=int, default=10_000)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--mode", choices=GENERATOR_MODES, default="frequency")
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--chunk", type=int, default=CHUNK_BOARDS, help="boards per task and per write")
+    parser.add_argument("--dictionary", default=None)
+    parser.add_argument("--output", default=None,
+                        help="write NDJSON here (gzipped if it ends in .gz) instead of to storage")
+    parser.add_argument("--storage", default=None,
+                        help="'postgres' or 'sqlite:<path>' (default: WORDHUNT_STORAGE)")
+    args = parser.parse_args()
+
+    batches = solve_boards(args.size, args.count, args.seed, args.mode, args.workers, args.chunk,
+                           args.dictionary)
+    started = time.perf_counter()
+    if args.output:
+        opener = gzip.open if args.output.endswith(".gz") else open
+        with opener(args.output, "wt") as out:
+            boards, words = run_pipeline(batches, lambda batch: write_ndjson(out, batch), args.count)
+    else:
+        from backend.storage import open_storage
+
+        storage = open_storage(args.storage)
+        try:
+            boards, words = run_pipeline(batches, storage.record_submissions, args.count)
+        finally:
+            storage.close()
+    elapsed = time.perf_counter() - started
+    print(f"Wrote {boards:,} boards ({words:,} words) in {elapsed:.1f}s, "
+          f"{boards / elapsed:,.0f} boards/s")
+
+
+if __name__ == "__main__":
+    main()
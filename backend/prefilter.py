@@ -0,0 +1,59 @@
+import time
+from collections import Counter
+
+from backend.board import Board
+from backend.compiled_trie import CompiledTrie
+from backend.trie import TrieMap
+
+# With a deadline the clock is read once every this many trie steps
+DEADLINE_CHECK_INTERVAL = 1024
+
+
+class _BuildExpired(Exception):
+    pass
+
+
+# Builds a small trie holding only the dictionary words that could appear on
+# the board: every letter count fits in the board's letter multiset and every
+# consecutive letter pair sits on some pair of adjacent cells. The walk only
+# uses the cursor API, so it works on TrieMap and CompiledTrie alike.
+# Returns None if deadline (a time.monotonic() value) passes first.
+def build_board_trie(dictionary: TrieMap | CompiledTrie, board: Board, min_length: int = 3,
+                     deadline: float | None = None) -> TrieMap | None:
+    letters = board.letters
+    remaining = Counter(letters)
+    followers: dict[str, set[str]] = {letter: set() for letter in remaining}
+    for cell, cell_neighbors in enumerate(board.neighbors):
+        for next_cell in cell_neighbors:
+            followers[letters[cell]].add(letters[next_cell])
+
+    child = dictionary.child
+    is_terminal = dictionary.is_terminal
+    trie = TrieMap()
+    path: list[str] = []
+    steps = [0]
+
+    def walk(node, candidates) -> None:
+        for letter in candidates:
+            if not remaining[letter]:
+                continue
+            next_node = child(node, letter)
+            if next_node is None:
+                continue
+            steps[0] += 1
+            if (deadline is not None and not steps[0] & (DEADLINE_CHECK_INTERVAL - 1)
+                    and time.monotonic() >= deadline):
+                raise _BuildExpired
+            remaining[letter] -= 1
+            path.append(letter)
+            if len(path) >= min_length and is_terminal(next_node):
+                trie.insert("".join(path))
+            walk(next_node, followers[letter])
+            path.pop()
+            remaining[letter] += 1
+
+    try:
+        walk(dictionary.root, list(remaining))
+    except _BuildExpired:
+        return None
+    return trie
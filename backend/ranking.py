@@ -0,0 +1,104 @@
+import threading
+from typing import Callable, Iterable
+
+# Every word scores a multiple of 100, so board totals are too; tree slot i
+# counts the boards whose total is (i - 1) * BUCKET_SIZE.
+BUCKET_SIZE = 100
+
+
+# In-process replacement for the COUNT(*) queries behind the percentile shown
+# after a solve. Board totals live in a Fenwick tree over score buckets, so
+# recording a board and counting the boards that scored at least as well are
+# both O(log n). The set of known boards keeps resubmissions from being
+# counted twice, and load() swaps in a fresh snapshot from the database.
+class ScoreIndex:
+
+    def __init__(self, rows: Iterable[tuple[str, int]] = (), capacity: int = 1024):
+        self._lock = threading.Lock()
+        self._tree = [0] * (capacity + 1)
+        self._boards: set[str] = set()
+        self.total = 0
+        self.loaded = False
+        for board, value in rows:
+            self._add(board, value)
+
+    def load(self, rows: Iterable[tuple[str, int]]) -> None:
+        fresh = ScoreIndex(rows)
+        with self._lock:
+            self._tree, self._boards, self.total = fresh._tree, fresh._boards, fresh.total
+            self.loaded = True
+
+    # Returns False (and counts nothing) if the board is already known.
+    def add(self, board: str, value: int) -> bool:
+        with self._lock:
+            return self._add(board, value)
+
+    # Same as COUNT(*) FILTER (WHERE value >= %s AND value != 0).
+    def count_at_least(self, value: int) -> int:
+        with self._lock:
+            return self._count_at_least(value)
+
+    # With board, a board the index does not know yet is counted as if it
+    # had been added with value, without adding it.
+    def percentile(self, value: int, board: str | None = None) -> float:
+        with self._lock:
+            extra = 1 if board is not None and board not in self._boards else 0
+            total = self.total + extra
+            better_than_me = self._count_at_least(value) + (extra if value != 0 else 0)
+            return round(((total - better_than_me) / max(total - 1, 1)) * 100, 2)
+
+    def __contains__(self, board: str) -> bool:
+        return board in self._boards
+
+    def _add(self, board: str, value: int) -> bool:
+        if board in self._boards:
+            return False
+        self._boards.add(board)
+        self.total += 1
+        i = value // BUCKET_SIZE + 1
+        while i >= len(self._tree):
+            self._grow()
+        while i < len(self._tree):
+            self._tree[i] += 1
+            i += i & -i
+        return True
+
+    def _count_at_least(self, value: int) -> int:
+        # Slots strictly below the first bucket that reaches value; never
+        # below slot 1, which holds the zero-score boards.
+        below = min(max(-(-value // BUCKET_SIZE), 1), len(self._tree) - 1)
+        return self._prefix(len(self._tree) - 1) - self._prefix(below)
+
+    def _prefix(self, i: int) -> int:
+        count = 0
+        while i > 0:
+            count += self._tree[i]
+            i -= i & -i
+        return count
+
+    def _grow(self) -> None:
+        size = len(self._tree) - 1
+        counts = [self._prefix(i) - self._prefix(i - 1) for i in range(1, size + 1)]
+        self._tree = [0] * (2 * size + 1)
+        for i, count in enumerate(counts, 1):
+            while i < len(self._tree):
+                self._tree[i] += count
+                i += i & -i
+
+
+# Re-seeds the index from fetch_rows() every interval seconds on a daemon
+# thread, picking up boards written by other app processes. Set the returned
+# event to stop it.
+def start_resync(index: ScoreIndex, fetch_rows: Callable[[], Iterable[tuple[str, int]]],
+                 interval: float = 300.0) -> threading.Event:
+    stop = threading.Event()
+
+    def run() -> None:
+        while not stop.wait(interval):
+            try:
+                index.load(fetch_rows())
+            except Exception as e:
+                print(f"Score index resync failed: {e}")
+
+    threading.Thread(target=run, name="score-index-resync", daemon=True).start()
+    return stop
@@ -0,0 +1,148 @@
+from typing import NamedTuple
+
+from backend.board import Board
+from backend.compiled_trie import CompiledTrie
+from backend.solver import Solver
+from backend.trie import TrieMap, letters_mask
+
+
+class WordDelta(NamedTuple):
+    added: list[tuple[str, int]]
+    removed: list[tuple[str, int]]
+
+
+# A board kept solved across single-letter edits. Every path that spells a
+# word is stored (as a tuple of cell ids) and indexed by each cell it uses.
+# So is every path that spells a dictionary prefix, with its trie node and
+# visited mask. set_cell() drops the paths through the edited cell, then
+# grows new ones outward from it: the cell on its own, and every stored
+# prefix that ends next to it and avoids it, extended by the new letter.
+# Every other path is still spelled by the same letters, so nothing away
+# from the edit is searched again.
+class SolverSession:
+
+    def __init__(self, dictionary: TrieMap | CompiledTrie, board: Board, min_length: int = 3):
+        self.dictionary = dictionary
+        self.board = board
+        self.min_length = max(min_length, 3)
+        # Trie steps taken by the last full or incremental search
+        self.nodes_visited = 0
+        self._scorer = Solver(dictionary, prefilter="off")
+        self._paths: dict[str, set[tuple[int, ...]]] = {}
+        self._cell_paths: list[dict[tuple[int, ...], str]] = [{} for _ in board.letters]
+        # Prefix paths keyed by their last cell, and the prefix paths through each cell
+        self._prefix_ends: list[dict[tuple[int, ...], tuple[object, int]]] = [{} for _ in board.letters]
+        self._prefix_cells: list[set[tuple[int, ...]]] = [set() for _ in board.letters]
+        for path, word in self._grow(range(len(board.letters))):
+            self._add_path(path, word)
+
+    @property
+    def words(self) -> set[str]:
+        return set(self._paths)
+
+    def results(self) -> list[tuple[str, int]]:
+        return self._scorer._rank_words(self._paths.keys())
+
+    def total_score(self) -> int:
+        return sum(self._scorer._calculate_score(word) for word in self._paths)
+
+    def set_cell(self, row: int, col: int, letter: str) -> WordDelta:
+        if not (0 <= row < self.board.rows and 0 <= col < self.board.cols):
+            raise ValueError(f"Cell ({row}, {col}) is outside the {self.board.rows}x{self.board.cols} board")
+        letter = letter.lower()
+        if len(letter) != 1 or not "a" <= letter <= "z":
+            raise ValueError(f"Expected a single letter, got {letter!r}")
+
+        cell = self.board.cell_id(row, col)
+        if self.board.letters[cell] == letter:
+            return WordDelta([], [])
+
+        touched: set[str] = set()
+        for path, word in list(self._cell_paths[cell].items()):
+            self._remove_path(path, word)
+            touched.add(word)
+        lost = {word for word in touched if word not in self._paths}
+        for path in self._prefix_cells[cell]:
+            del self._prefix_ends[path[-1]][path]
+            for other in path:
+                if other != cell:
+                    self._prefix_cells[other].discard(path)
+        self._prefix_cells[cell] = set()
+
+        self.board.letters[cell] = letter
+        self.board.grid[row][col] = letter
+        self.board.letter_mask = letters_mask(self.board.letters)
+
+        gained = set()
+        for path, word in self._grow([cell], cell):
+            if word not in self._paths:
+                gained.add(word)
+            self._add_path(path, word)
+
+        return WordDelta(self._scorer._rank_words(gained - lost), self._scorer._rank_words(lost - gained))
+
+    def _add_path(self, path: tuple[int, ...], word: str) -> None:
+        self._paths.setdefault(word, set()).add(path)
+        for cell in path:
+            self._cell_paths[cell][path] = word
+
+    def _remove_path(self, path: tuple[int, ...], word: str) -> None:
+        paths = self._paths[word]
+        paths.discard(path)
+        if not paths:
+            del self._paths[word]
+        for cell in path:
+            self._cell_paths[cell].pop(path, None)
+
+    # Stores every prefix path that starts at one of starts, or (with
+    # through) that ends in a stored prefix next to through and then steps
+    # onto it, together with all of their extensions, and returns the
+    # (path, word) pairs among them. Stored prefixes are only cut by length,
+    # not by the letters on the board, since those change with every edit.
+    def _grow(self, starts, through: int | None = None) -> list[tuple[tuple[int, ...], str]]:
+        letters = self.board.letters
+        neighbors = self.board.neighbors
+        child = self.dictionary.child
+        is_terminal = self.dictionary.is_terminal
+        can_extend = self.dictionary.can_extend
+        prefix_ends = self._prefix_ends
+        prefix_cells = self._prefix_cells
+        cell_count = len(letters)
+        floor = self.min_length
+        found = []
+
+        def walk(path: tuple[int, ...], node, visited: int) -> None:
+            prefix_ends[path[-1]][path] = (node, visited)
+            for cell in path:
+                prefix_cells[cell].add(path)
+            if len(path) >= floor and is_terminal(node):
+                found.append((path, "".join(letters[cell] for cell in path)))
+            if not can_extend(node, 0, cell_count - len(path)):
+                return
+            for next_cell in neighbors[path[-1]]:
+                if visited >> next_cell & 1:
+                    continue
+                next_node = child(node, letters[next_cell])
+                if next_node is not None:
+                    visits[0] += 1
+                    walk(path + (next_cell,), next_node, visited | 1 << next_cell)
+
+        visits = [0]
+        seeds = []
+        for start in starts:
+            node = child(self.dictionary.root, letters[start])
+            if node is not None:
+                seeds.append(((start,), node, 1 << start))
+        if through is not None:
+            for neighbor in neighbors[through]:
+                for path, (node, visited) in prefix_ends[neighbor].items():
+                    if visited >> through & 1:
+                        continue
+                    next_node = child(node, letters[through])
+                    if next_node is not None:
+                        seeds.append((path + (through,), next_node, visited | 1 << through))
+        for path, node, visited in seeds:
+            visits[0] += 1
+            walk(path, node, visited)
+        self.nodes_visited = visits[0]
+        return found
@@ -1,79 +1,418 @@
+import heapq
+import math
+import os
+import threading
+import time
+from typing import Iterator, NamedTuple
+
 from backend import Board, TrieMap
+from backend.trie import ALL_LETTERS
+from backend.cache import SolveCache
+from backend.compiled_trie import CompiledTrie
+from backend.prefilter import build_board_trie
+
+# Point WORDHUNT_DICTIONARY at a compiled .bin file (python -m backend.compiled_trie)
+# to memory-map the trie instead of parsing the word list on startup.
+DEFAULT_DICTIONARY_PATH = os.environ.get("WORDHUNT_DICTIONARY", "backend/dictionary.txt")
+
+_dictionary_lock = threading.Lock()
+_dictionaries: dict[str, TrieMap | CompiledTrie] = {}
+_dictionary_stats: dict[str, dict] = {}
+
+SOLVE_CACHE_SIZE = int(os.environ.get("WORDHUNT_CACHE_SIZE", "1024"))
+# Upper bound on the time a web request may spend in the DFS
+WEB_DEADLINE_MS = float(os.environ.get("WORDHUNT_DEADLINE_MS", "2000"))
+_solve_cache: SolveCache | None = None
+
+ENGINES = ("recursive", "iterative")
+PREFILTER_MODES = ("auto", "on", "off")
+# A per-board trie (backend/prefilter.py) only beats the full one on boards
+# of very few distinct letters, each covering many cells, where the DFS keeps
+# revisiting the same prefixes. Its build cost grows with the number of
+# distinct letters and the board size, so ordinary boards of any size stay on
+# the full trie; see benchmarks/bench_prefilter.py.
+PREFILTER_MAX_LETTERS = 4
+PREFILTER_MIN_CELLS_PER_LETTER = 6
+
+# With a deadline the clock is read once every DEADLINE_CHECK_INTERVAL trie
+# steps; it must be a power of two.
+DEADLINE_CHECK_INTERVAL = 1024
+
+
+class _DeadlineExceeded(Exception):
+    pass
+
+
+class BoardScore(NamedTuple):
+    total_score: int
+    word_count: int
+    # word length -> number of distinct words of that length
+    length_counts: dict[int, int]
+
 
 class Solver:
     
-    def __init__(self, dictionary: TrieMap):
+    def __init__(self, dictionary: TrieMap | CompiledTrie, engine: str = "recursive",
+                 prefilter: str = "auto"):
+        if engine not in ENGINES:
+            raise ValueError(f"Unknown solver engine {engine!r}, expected one of {ENGINES}")
+        if prefilter not in PREFILTER_MODES:
+            raise ValueError(f"Unknown prefilter mode {prefilter!r}, expected one of {PREFILTER_MODES}")
         self.dictionary = dictionary
+        self.engine = engine
+        self.prefilter = prefilter
         self.found_words: set[str] = set()
+        self.nodes_visited = 0
+        self.partial = False
+        self.cells_covered = 0
+        self._begin()
+    
+    # top_k keeps only the k best (score, then alphabetical) words and
+    # min_length drops shorter ones; both also prune the search, since no
+    # branch can beat the length of the longest word below its node.
+    # With deadline_ms the search stops once that many milliseconds have
+    # passed and returns the words found so far; partial is then True and
+    # cells_covered counts the start cells that were searched completely.
+    def solve(self, board: Board, top_k: int | None = None, min_length: int = 3,
+              deadline_ms: float | None = None) -> list[tuple[str, int]]:
+        if top_k is not None and top_k < 1:
+            raise ValueError("top_k must be at least 1")
+        deadline = None if deadline_ms is None else time.monotonic() + deadline_ms / 1000
+        
+        filtered = self._filtered_solver(board, deadline)
+        if filtered is not None:
+            remaining_ms = None if deadline is None else max(deadline - time.monotonic(), 0) * 1000
+            results = filtered.solve(board, top_k, min_length, remaining_ms)
+            self.found_words = filtered.found_words
+            self.nodes_visited = filtered.nodes_visited
+            self.partial = filtered.partial
+            self.cells_covered = filtered.cells_covered
+            return results
+        
+        self._begin(top_k, min_length, deadline)
+        
+        try:
+            for cell in range(len(board.letters)):
+                # The DFS only reads the clock every DEADLINE_CHECK_INTERVAL
+                # steps, which a single start cell may never reach
+                if deadline is not None and time.monotonic() >= deadline:
+                    raise _DeadlineExceeded
+                self._search_cell(board, cell)
+                self.cells_covered += 1
+        except _DeadlineExceeded:
+            self.partial = True
+        
+        if top_k is not None:
+            return self._rank_heap()
+        return self._rank_words(self.found_words)
+    
+    # Yields (word, score) pairs as the search finds them, flushed after each
+    # start cell, instead of ranking everything at the end. found_words and
+    # nodes_visited are complete once the generator is exhausted; deadline_ms
+    # works as in solve().
+    def iter_words(self, board: Board, min_length: int = 3,
+                   deadline_ms: float | None = None) -> Iterator[tuple[str, int]]:
+        deadline = None if deadline_ms is None else time.monotonic() + deadline_ms / 1000
+        filtered = self._filtered_solver(board, deadline)
+        if filtered is not None:
+            remaining_ms = None if deadline is None else max(deadline - time.monotonic(), 0) * 1000
+            yield from filtered.iter_words(board, min_length, remaining_ms)
+            self.found_words = filtered.found_words
+            self.nodes_visited = filtered.nodes_visited
+            self.partial = filtered.partial
+            self.cells_covered = filtered.cells_covered
+            return
+        
+        self._begin(min_length=min_length, deadline=deadline)
+        found = self.found_words
+        pending: list[str] = []
+        
+        def add_word(word: str) -> None:
+            if word not in found:
+                found.add(word)
+                pending.append(word)
+        
+        self._add_word = add_word
+        try:
+            for cell in range(len(board.letters)):
+                if deadline is not None and time.monotonic() >= deadline:
+                    raise _DeadlineExceeded
+                self._search_cell(board, cell)
+                self.cells_covered += 1
+                for word in pending:
+                    yield word, self._calculate_score(word)
+                pending.clear()
+        except _DeadlineExceeded:
+            self.partial = True
+        for word in pending:
+            yield word, self._calculate_score(word)
     
-    def solve(self, board: Board) -> list[tuple[str, int]]:
-        self.found_words.clear()
+    # Total score and per-length word counts without building any word. A
+    # word is identified by its terminal trie node, so found words are
+    # deduplicated as a set of nodes and counted by the depth they end at.
+    def score(self, board: Board, min_length: int = 3) -> BoardScore:
+        filtered = self._filtered_solver(board)
+        if filtered is not None:
+            scored = filtered.score(board, min_length)
+            self.nodes_visited = filtered.nodes_visited
+            return scored
         
-        for row in range(board.rows):
-            for col in range(board.cols):
-                visited = set()
-                current_path = []
-                self._dfs(board, row, col, visited, current_path, "")
+        self._begin(min_length=min_length)
+        missing_letters = ALL_LETTERS & ~board.letter_mask
+        found_nodes = set()
+        counts = [0] * (len(board.letters) + 1)
+        for cell in range(len(board.letters)):
+            self._score_cell(board.letters, board.neighbors, cell, missing_letters, found_nodes, counts)
         
-        words_with_scores = [(word, self._calculate_score(word)) for word in self.found_words]
+        length_counts = {length: count for length, count in enumerate(counts) if count}
+        total = sum(_length_score(length) * count for length, count in length_counts.items())
+        return BoardScore(total, len(found_nodes), length_counts)
+    
+    def _begin(self, top_k: int | None = None, min_length: int = 3,
+               deadline: float | None = None) -> None:
+        self.found_words = set()
+        self.nodes_visited = 0
+        self.partial = False
+        self.cells_covered = 0
+        self._deadline = deadline
+        self._length_floor = max(min_length, 3)
+        self._top_k = top_k
+        self._heap: list[tuple[int, tuple[int, ...], str]] = []
+        self._add_word = self.found_words.add if top_k is None else self._offer_word
+    
+    # The heap root is the entry top_k would drop first: lowest score, then
+    # alphabetically last. Once the heap is full only words at least as long
+    # as the root's can still get in, which raises the search's length floor.
+    def _offer_word(self, word: str) -> None:
+        if word in self.found_words:
+            return
+        entry = (self._calculate_score(word), tuple(-ord(char) for char in word) + (0,), word)
+        if len(self._heap) < self._top_k:
+            heapq.heappush(self._heap, entry)
+        elif entry > self._heap[0]:
+            self.found_words.discard(heapq.heapreplace(self._heap, entry)[2])
+        else:
+            return
+        self.found_words.add(word)
+        if len(self._heap) == self._top_k:
+            self._length_floor = max(self._length_floor, len(self._heap[0][2]))
+    
+    def _rank_heap(self) -> list[tuple[str, int]]:
+        return [(word, score) for score, _, word in sorted(self._heap, reverse=True)]
+    
+    def _rank_words(self, words: set[str]) -> list[tuple[str, int]]:
+        words_with_scores = [(word, self._calculate_score(word)) for word in words]
         
         words_with_scores.sort(key=lambda x: (-x[1], x[0]))
         
         return words_with_scores
     
-    def _dfs(self, board: Board, row: int, col: int, visited: set[tuple[int, int]], 
-             current_path: list[tuple[int, int]], current_word: str) -> None:
-        letter = board.get_letter(row, col)
-        if letter is None or (row, col) in visited:
+    def _use_prefilter(self, board: Board) -> bool:
+        if self.prefilter == "auto":
+            distinct = len(set(board.letters))
+            return (distinct <= PREFILTER_MAX_LETTERS
+                    and len(board.letters) >= PREFILTER_MIN_CELLS_PER_LETTER * distinct)
+        return self.prefilter == "on"
+    
+    # A solver over the board's pre-filtered trie when the prefilter applies
+    # and its build finishes before the deadline, otherwise None and the
+    # search runs on the full trie.
+    def _filtered_solver(self, board: Board, deadline: float | None = None) -> "Solver | None":
+        if not self._use_prefilter(board):
+            return None
+        trie = build_board_trie(self.dictionary, board, deadline=deadline)
+        return None if trie is None else Solver(trie, self.engine, prefilter="off")
+    
+    # Branches are cut with the trie's subtree annotations: every word below
+    # needs a letter that is not on the board, or more cells than remain.
+    def _search_cell(self, board: Board, cell: int) -> None:
+        missing_letters = ALL_LETTERS & ~board.letter_mask
+        if self.engine == "iterative":
+            self._dfs_iterative(board.letters, board.neighbors, cell, missing_letters)
+        else:
+            self._dfs(board.letters, board.neighbors, cell, 0, [], self.dictionary.root, missing_letters)
+    
+    # Carries the trie node for the current prefix so each step follows a
+    # single edge; the word string is only built when a node ends a word.
+    # Visited cells are bits of an int, so backtracking needs no cleanup.
+    def _dfs(self, letters: list[str], neighbors: tuple[tuple[int, ...], ...], cell: int,
+             visited: int, path: list[str], node, missing_letters: int) -> None:
+        letter = letters[cell]
+        node = self.dictionary.child(node, letter)
+        if node is None:
             return
         
-        current_word += letter
-        visited.add((row, col))
-        current_path.append((row, col))
+        self.nodes_visited += 1
+        if (self._deadline is not None and not self.nodes_visited & (DEADLINE_CHECK_INTERVAL - 1)
+                and time.monotonic() >= self._deadline):
+            raise _DeadlineExceeded
+        visited |= 1 << cell
+        path.append(letter)
+        
+        floor = self._length_floor
+        if len(path) >= floor and self.dictionary.is_terminal(node):
+            self._add_word("".join(path))
+        
+        free_cells = len(letters) - len(path)
+        if (self.dictionary.can_extend(node, missing_letters, free_cells)
+                and (floor <= 3 or len(path) + min(self.dictionary.max_depth(node), free_cells) >= floor)):
+            for next_cell in neighbors[cell]:
+                if not visited >> next_cell & 1:
+                    self._dfs(letters, neighbors, next_cell, visited, path, node, missing_letters)
+        
+        path.pop()
+    
+    # Same traversal as _dfs with an explicit stack of (node, visited, pending
+    # neighbors) frames, so there is no Python call per cell and no recursion limit.
+    def _dfs_iterative(self, letters: list[str], neighbors: tuple[tuple[int, ...], ...],
+                       start: int, missing_letters: int) -> None:
+        child = self.dictionary.child
+        is_terminal = self.dictionary.is_terminal
+        can_extend = self.dictionary.can_extend
+        max_depth = self.dictionary.max_depth
+        add_word = self._add_word
+        deadline = self._deadline
+        cell_count = len(letters)
+        
+        node = child(self.dictionary.root, letters[start])
+        if node is None:
+            return
         
-        if not self.dictionary.starts_with(current_word):
-            visited.remove((row, col))
-            current_path.pop()
+        self.nodes_visited += 1
+        if not can_extend(node, missing_letters, cell_count - 1):
             return
         
-        if len(current_word) >= 3 and self.dictionary.search(current_word):
-            self.found_words.add(current_word)
+        visits = 0
+        path = [letters[start]]
+        stack = [(node, 1 << start, iter(neighbors[start]))]
+        while stack:
+            node, visited, pending = stack[-1]
+            for next_cell in pending:
+                if visited >> next_cell & 1:
+                    continue
+                letter = letters[next_cell]
+                next_node = child(node, letter)
+                if next_node is None:
+                    continue
+                visits += 1
+                if (deadline is not None and not visits & (DEADLINE_CHECK_INTERVAL - 1)
+                        and time.monotonic() >= deadline):
+                    self.nodes_visited += visits
+                    raise _DeadlineExceeded
+                path.append(letter)
+                floor = self._length_floor
+                if len(path) >= floor and is_terminal(next_node):
+                    add_word("".join(path))
+                free_cells = cell_count - len(path)
+                if (can_extend(next_node, missing_letters, free_cells)
+                        and (floor <= 3 or len(path) + min(max_depth(next_node), free_cells) >= floor)):
+                    stack.append((next_node, visited | 1 << next_cell, iter(neighbors[next_cell])))
+                    break
+                path.pop()
+            else:
+                stack.pop()
+                path.pop()
+        self.nodes_visited += visits
+    
+    # _dfs_iterative with the path reduced to its depth: a new terminal node
+    # bumps counts[depth], and nothing is allocated per word.
+    def _score_cell(self, letters: list[str], neighbors: tuple[tuple[int, ...], ...], start: int,
+                    missing_letters: int, found_nodes: set, counts: list[int]) -> None:
+        child = self.dictionary.child
+        is_terminal = self.dictionary.is_terminal
+        can_extend = self.dictionary.can_extend
+        floor = self._length_floor
+        cell_count = len(letters)
         
-        neighbors = board.get_neighbors(row, col)
-        for new_row, new_col in neighbors:
-            if (new_row, new_col) not in visited:
-                self._dfs(board, new_row, new_col, visited, current_path, current_word)
+        node = child(self.dictionary.root, letters[start])
+        if node is None:
+            return
         
-        visited.remove((row, col))
-        current_path.pop()
+        self.nodes_visited += 1
+        if not can_extend(node, missing_letters, cell_count - 1):
+            return
+        
+        visits = 0
+        stack = [(node, 1 << start, iter(neighbors[start]))]
+        while stack:
+            node, visited, pending = stack[-1]
+            for next_cell in pending:
+                if visited >> next_cell & 1:
+                    continue
+                next_node = child(node, letters[next_cell])
+                if next_node is None:
+                    continue
+                visits += 1
+                depth = len(stack) + 1
+                if depth >= floor and is_terminal(next_node) and next_node not in found_nodes:
+                    found_nodes.add(next_node)
+                    counts[depth] += 1
+                if can_extend(next_node, missing_letters, cell_count - depth):
+                    stack.append((next_node, visited | 1 << next_cell, iter(neighbors[next_cell])))
+                    break
+            else:
+                stack.pop()
+        self.nodes_visited += visits
     
     def _calculate_score(self, word: str) -> int:
-        length = len(word)
-        
-        if length == 3:
-            return 100
-        if length > 3 and length < 6:
-            return (length - 3) * 400
-        return (length - 3) * 400 + 200
+        return _length_score(len(word))
 
     def get_total_score(self, found_words: list[tuple[str, int]]) -> int:
         return sum(score for _, score in found_words)
 
-def load_dictionary(dictionary_path: str | None = None) -> TrieMap:
+def _length_score(length: int) -> int:
+    if length == 3:
+        return 100
+    if length > 3 and length < 6:
+        return (length - 3) * 400
+    return (length - 3) * 400 + 200
+
+def load_dictionary(dictionary_path: str | None = None) -> TrieMap | CompiledTrie:
+    path = dictionary_path or DEFAULT_DICTIONARY_PATH
+    if path.endswith(".bin"):
+        return CompiledTrie(path)
+    
     trie = TrieMap()
+    trie.load_from_file(path)
     
-    if dictionary_path:
-        trie.load_from_file(dictionary_path)
-    else:
+    return trie
 
-        trie.load_from_file("backend/dictionary.txt")
+# Process-wide dictionary registry: each path is loaded once and the same
+# TrieMap is shared by every request and solver in this process.
+def get_dictionary(dictionary_path: str | None = None) -> TrieMap | CompiledTrie:
+    path = dictionary_path or DEFAULT_DICTIONARY_PATH
+    dictionary = _dictionaries.get(path)
+    if dictionary is not None:
+        return dictionary
     
-    return trie
+    with _dictionary_lock:
+        if path not in _dictionaries:
+            started = time.perf_counter()
+            dictionary = load_dictionary(path)
+            _dictionary_stats[path] = {
+                "path": path,
+                "load_seconds": time.perf_counter() - started,
+                "words": dictionary.size,
+                "nodes": dictionary.node_count,
+            }
+            _dictionaries[path] = dictionary
+        return _dictionaries[path]
+
+def dictionary_stats(dictionary_path: str | None = None) -> dict | None:
+    stats = _dictionary_stats.get(dictionary_path or DEFAULT_DICTIONARY_PATH)
+    return dict(stats) if stats else None
+
+def clear_dictionaries() -> None:
+    global _solve_cache
+    with _dictionary_lock:
+        _dictionaries.clear()
+        _dictionary_stats.clear()
+        _solve_cache = None
 
 # Console solver for the command line
 # Testing purposes only
 def console_solver():
-    dictionary = load_dictionary()
+    dictionary = get_dictionary()
 
     
     print("\nEnter the letter grid (left-to-right, top-to-bottom):")
@@ -99,14 +438,50 @@ def console_solver():
     for i, (word, score) in enumerate(results, 1):
         print(f"{i}. {word} ({score})")
 
-def web_solver(input_grid: str) -> tuple[list[tuple[str, int]], int]:
+# Results for recently solved boards (up to rotation/reflection) are served
+# from an LRU cache shared by every request.
+def get_solve_cache() -> SolveCache:
+    global _solve_cache
+    if _solve_cache is None:
+        dictionary = get_dictionary()
+        with _dictionary_lock:
+            if _solve_cache is None:
+                _solve_cache = SolveCache(lambda board: Solver(dictionary).solve(board), SOLVE_CACHE_SIZE)
+    return _solve_cache
+
+class WebSolve(NamedTuple):
+    results: list[tuple[str, int]]
+    total_score: int
+    partial: bool
+    cells_covered: int
 
-    dictionary = load_dictionary()
+
+# The search budget for a web request: deadline_ms clamped to
+# [0, WEB_DEADLINE_MS]. NaN or infinite values would never trip the deadline
+# check, so they (like a missing value) get the full WEB_DEADLINE_MS.
+def web_deadline_ms(deadline_ms: float | None = None) -> float:
+    if deadline_ms is None or not math.isfinite(deadline_ms):
+        return WEB_DEADLINE_MS
+    return min(max(deadline_ms, 0.0), WEB_DEADLINE_MS)
+
+# Solves through the shared cache within deadline_ms (never more than
+# WEB_DEADLINE_MS). Partial results are returned but never cached.
+def web_solve(input_grid: str, deadline_ms: float | None = None) -> WebSolve:
     board = Board(input_grid)
-    solver = Solver(dictionary)
-    results = solver.solve(board)
-    total_score = solver.get_total_score(results)
-    return results, total_score
+    cache = get_solve_cache()
+    results = cache.lookup(board)
+    if results is not None:
+        return WebSolve(results, sum(score for _, score in results), False, len(board.letters))
+    
+    solver = Solver(get_dictionary())
+    results = solver.solve(board, deadline_ms=web_deadline_ms(deadline_ms))
+    if not solver.partial:
+        cache.store(board, results)
+    return WebSolve(results, sum(score for _, score in results), solver.partial, solver.cells_covered)
+
+def web_solver(input_grid: str) -> tuple[list[tuple[str, int]], int]:
+    solved = web_solve(input_grid)
+    return solved.results, solved.total_score
 
 if __name__ == "__main__":
     console_solver()
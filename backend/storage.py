@@ -0,0 +1,285 @@
+import os
+import sqlite3
+import threading
+from abc import ABC, abstractmethod
+from contextlib import contextmanager
+from typing import Iterator
+
+from psycopg2.extras import execute_values
+
+from backend.bulk import COPY_MIN_ROWS, copy_rows
+from backend.database import ConnectionPool
+from backend.leaderboard import (INSERT_COLUMNS, LENGTH_COLUMNS, SCHEMA as LEADERBOARD_SCHEMA,
+                                 LeaderboardPage, ensure_schema, leaderboard_page, length_scores_row)
+from backend.ranking import ScoreIndex, start_resync
+from backend.writer import Submission
+
+# "postgres" (the default) or "sqlite:<path>"
+DEFAULT_STORAGE = os.environ.get("WORDHUNT_STORAGE", "postgres")
+SCORE_INDEX_RESYNC_SECONDS = 300.0
+
+
+# Everything the app persists or reads back about solved boards. Subclasses
+# provide the SQL; percentiles are answered here from a ScoreIndex that is
+# seeded from board_values() on first use and re-seeded periodically.
+class Storage(ABC):
+
+    def __init__(self, resync_interval: float = SCORE_INDEX_RESYNC_SECONDS):
+        self.score_index = ScoreIndex()
+        self.resync_interval = resync_interval
+        self._index_lock = threading.Lock()
+        self._resync_stop: threading.Event | None = None
+
+    # Stores each board's total, per-length scores and word list. Boards
+    # that are already stored are left untouched.
+    @abstractmethod
+    def record_submissions(self, batch: list[Submission]) -> None:
+        ...
+
+    @abstractmethod
+    def board_values(self) -> list[tuple[str, int]]:
+        ...
+
+    @abstractmethod
+    def leaderboard_page(self, lengths: list[int], after: tuple[int, str] | None = None,
+                         before: tuple[int, str] | None = None) -> LeaderboardPage:
+        ...
+
+    # The stored (word, score) rows for a board, unordered.
+    @abstractmethod
+    def board_words(self, board: str) -> list[tuple[str, int]]:
+        ...
+
+    # Whether the board is already stored. Answered from the score index,
+    # which the first call loads with one query.
+    def is_known(self, board: str) -> bool:
+        self._ensure_score_index()
+        return board in self.score_index
+
+    # The stored words for a known board ranked like the solver ranks them,
+    # plus their total, or None if the board's rows have not been written yet.
+    def stored_results(self, board: str) -> tuple[list[tuple[str, int]], int] | None:
+        rows = self.board_words(board)
+        if not rows:
+            return None
+        results = sorted(((word, value) for word, value in rows), key=lambda x: (-x[1], x[0]))
+        return results, sum(value for _, value in results)
+
+    # The share of stored boards this one beats, counting it among them even
+    # if it has not been written yet.
+    def percentile(self, board: str, total_score: int) -> float:
+        self._ensure_score_index()
+        return self.score_index.percentile(total_score, board)
+
+    # The background writer's entry point: stores the batch, and only then
+    # adds its boards to the score index, so a board becomes known once it
+    # is in the database and a dropped batch leaves nothing behind.
+    def write_batch(self, batch: list[Submission]) -> None:
+        self.record_submissions(batch)
+        if self.score_index.loaded:
+            for submission in batch:
+                self.score_index.add(submission.board, submission.total_score)
+
+    def close(self) -> None:
+        if self._resync_stop is not None:
+            self._resync_stop.set()
+
+    def _ensure_score_index(self) -> None:
+        if self.score_index.loaded:
+            return
+        with self._index_lock:
+            if not self.score_index.loaded:
+                self.score_index.load(self.board_values())
+                self._resync_stop = start_resync(self.score_index, self.board_values, self.resync_interval)
+
+    @staticmethod
+    def _dedupe(batch: list[Submission]) -> list[Submission]:
+        boards = {}
+        for submission in batch:
+            boards.setdefault(submission.board, submission)
+        return list(boards.values())
+
+
+class PostgresStorage(Storage):
+
+    def __init__(self, pool: ConnectionPool | None = None, copy_min_rows: int = COPY_MIN_ROWS, **kwargs):
+        super().__init__(**kwargs)
+        self.pool = pool or ConnectionPool()
+        self.copy_min_rows = copy_min_rows
+        self._schema_ready = False
+
+    # One transaction per batch: a multi-row insert each for board_values and
+    # board_length_scores, and one for every board_words row in the batch, or
+    # a COPY through a staging table once there are copy_min_rows of them.
+    def record_submissions(self, batch: list[Submission]) -> None:
+        submissions = self._dedupe(batch)
+        board_rows = [(s.board, s.total_score) for s in submissions]
+        length_rows = [length_scores_row(s.board, s.results) for s in submissions]
+        word_rows = [(s.board, word, score) for s in submissions for word, score in s.results]
+        with self.pool.connection() as conn:
+            self._ensure_schema(conn)
+            cur = conn.cursor()
+            execute_values(cur, '''
+            INSERT INTO board_values (board, value) VALUES %s ON CONFLICT (board) DO NOTHING
+            ''', board_rows)
+            execute_values(cur, f'''
+            INSERT INTO board_length_scores ({INSERT_COLUMNS}) VALUES %s ON CONFLICT (board) DO NOTHING
+            ''', length_rows)
+            if len(word_rows) >= self.copy_min_rows:
+                copy_rows(cur, "board_words", ("board", "word", "value"), word_rows)
+            elif word_rows:
+                execute_values(cur, '''
+                INSERT INTO board_words (board, word, value)
+                VALUES %s ON CONFLICT (board, word) DO NOTHING
+                ''', word_rows, page_size=1000)
+            conn.commit()
+            cur.close()
+
+    def board_values(self) -> list[tuple[str, int]]:
+        with self.pool.connection() as conn:
+            cur = conn.cursor()
+            cur.execute('SELECT board, value FROM board_values;')
+            rows = cur.fetchall()
+            cur.close()
+        return rows
+
+    def board_words(self, board: str) -> list[tuple[str, int]]:
+        with self.pool.connection() as conn:
+            cur = conn.cursor()
+            cur.execute('SELECT word, value FROM board_words WHERE board = %s;', (board,))
+            rows = cur.fetchall()
+            cur.close()
+        return rows
+
+    def leaderboard_page(self, lengths: list[int], after: tuple[int, str] | None = None,
+                         before: tuple[int, str] | None = None) -> LeaderboardPage:
+        with self.pool.connection() as conn:
+            self._ensure_schema(conn)
+            cur = conn.cursor()
+            page = leaderboard_page(cur, lengths, after=after, before=before)
+            cur.close()
+        return page
+
+    def close(self) -> None:
+        super().close()
+        self.pool.close()
+
+    # board_length_scores is created (and backfilled from board_words) by the
+    # first process that needs it
+    def _ensure_schema(self, conn) -> None:
+        if not self._schema_ready:
+            ensure_schema(conn)
+            self._schema_ready = True
+
+
+SQLITE_SCHEMA = '''
+CREATE TABLE IF NOT EXISTS board_values (
+    board TEXT PRIMARY KEY,
+    value INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS board_words (
+    board TEXT NOT NULL,
+    word TEXT NOT NULL,
+    value INTEGER NOT NULL,
+    PRIMARY KEY (board, word)
+);
+''' + LEADERBOARD_SCHEMA
+
+
+# Runs the psycopg2-style queries in backend.leaderboard on sqlite3.
+class _QmarkCursor:
+
+    def __init__(self, cursor: sqlite3.Cursor):
+        self._cursor = cursor
+
+    def execute(self, query: str, params=()) -> None:
+        self._cursor.execute(query.replace("%s", "?"), params)
+
+    def fetchall(self) -> list:
+        return self._cursor.fetchall()
+
+    def fetchone(self):
+        return self._cursor.fetchone()
+
+
+# Embedded storage in a single SQLite file, for running the whole request
+# path on one machine. The database is in WAL mode so the writer thread does
+# not block readers. Connections come from a small pool of at most
+# max_connections, since the dev server starts a thread per request; each
+# batch of submissions is one transaction of executemany inserts.
+class SqliteStorage(Storage):
+
+    def __init__(self, path: str = "wordhunt.db", max_connections: int = 4, **kwargs):
+        super().__init__(**kwargs)
+        self.path = path
+        self.opened = 0
+        self._idle: list[sqlite3.Connection] = []
+        self._slots = threading.BoundedSemaphore(max_connections)
+        self._lock = threading.Lock()
+        with self._connection() as conn:
+            conn.execute("PRAGMA journal_mode=WAL;")
+            conn.executescript(SQLITE_SCHEMA)
+
+    def record_submissions(self, batch: list[Submission]) -> None:
+        submissions = self._dedupe(batch)
+        placeholders = ", ".join("?" * (len(LENGTH_COLUMNS) + 2))
+        with self._connection() as conn, conn:
+            conn.executemany("INSERT OR IGNORE INTO board_values (board, value) VALUES (?, ?)",
+                             [(s.board, s.total_score) for s in submissions])
+            conn.executemany(f"INSERT OR IGNORE INTO board_length_scores ({INSERT_COLUMNS}) VALUES ({placeholders})",
+                             [length_scores_row(s.board, s.results) for s in submissions])
+            conn.executemany("INSERT OR IGNORE INTO board_words (board, word, value) VALUES (?, ?, ?)",
+                             [(s.board, word, score) for s in submissions for word, score in s.results])
+
+    def board_values(self) -> list[tuple[str, int]]:
+        with self._connection() as conn:
+            return conn.execute("SELECT board, value FROM board_values;").fetchall()
+
+    def board_words(self, board: str) -> list[tuple[str, int]]:
+        with self._connection() as conn:
+            return conn.execute("SELECT word, value FROM board_words WHERE board = ?;", (board,)).fetchall()
+
+    def leaderboard_page(self, lengths: list[int], after: tuple[int, str] | None = None,
+                         before: tuple[int, str] | None = None) -> LeaderboardPage:
+        with self._connection() as conn:
+            cur = conn.cursor()
+            try:
+                return leaderboard_page(_QmarkCursor(cur), lengths, after=after, before=before)
+            finally:
+                cur.close()
+
+    def close(self) -> None:
+        super().close()
+        with self._lock:
+            idle, self._idle = self._idle, []
+        for conn in idle:
+            conn.close()
+
+    @contextmanager
+    def _connection(self) -> Iterator[sqlite3.Connection]:
+        self._slots.acquire()
+        try:
+            with self._lock:
+                conn = self._idle.pop() if self._idle else None
+            if conn is None:
+                conn = sqlite3.connect(self.path, timeout=30, check_same_thread=False)
+                conn.execute("PRAGMA synchronous=NORMAL;")
+                self.opened += 1
+            try:
+                yield conn
+            finally:
+                if conn.in_transaction:
+                    conn.rollback()
+                with self._lock:
+                    self._idle.append(conn)
+        finally:
+            self._slots.release()
+
+
+def open_storage(spec: str | None = None) -> Storage:
+    spec = spec or DEFAULT_STORAGE
+    if spec == "postgres":
+        return PostgresStorage()
+    if spec.startswith("sqlite:"):
+        return SqliteStorage(spec[len("sqlite:"):] or "wordhunt.db")
+    raise ValueError(f"Unknown storage {spec!r}; expected 'postgres' or 'sqlite:<path>'")
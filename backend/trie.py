@@ -1,15 +1,42 @@
 
+ALL_LETTERS = (1 << 26) - 1
+NO_WORDS_BELOW = 255
+
+
+def letter_bit(char: str) -> int:
+    if "a" <= char <= "z":
+        return 1 << (ord(char) - 97)
+    return 0
+
+
+def letters_mask(letters) -> int:
+    mask = 0
+    for char in letters:
+        mask |= letter_bit(char)
+    return mask
+
+
 class TrieNode:
+    __slots__ = ("children", "is_word", "word", "letter_mask", "min_depth", "max_depth")
+    
+    # letter_mask holds the a-z letters that every word below this node still
+    # needs, min_depth/max_depth the fewest/most letters still needed to finish
+    # one. insert() keeps them exact, so a search can drop a branch whose words
+    # all need a letter the board lacks or more cells than are left.
     def __init__(self):
         self.children = {}
         self.is_word = False
         self.word = None
+        self.letter_mask = ALL_LETTERS
+        self.min_depth = NO_WORDS_BELOW
+        self.max_depth = 0
 
 
 class TrieMap:
     def __init__(self):
         self.root = TrieNode()
         self.size = 0
+        self.node_count = 1
     
     def insert(self, word: str) -> None:
         if not word:
@@ -18,9 +45,18 @@ class TrieMap:
         word = word.lower().strip()
         node = self.root
         
-        for char in word:
+        suffix_masks = [0] * (len(word) + 1)
+        for i in range(len(word) - 1, -1, -1):
+            suffix_masks[i] = suffix_masks[i + 1] | letter_bit(word[i])
+        
+        for i, char in enumerate(word):
+            remaining = len(word) - i
+            node.letter_mask &= suffix_masks[i]
+            node.min_depth = min(node.min_depth, remaining)
+            node.max_depth = max(node.max_depth, remaining)
             if char not in node.children:
                 node.children[char] = TrieNode()
+                self.node_count += 1
             node = node.children[char]
         
         if not node.is_word:
@@ -36,6 +72,20 @@ class TrieMap:
         node = self._find_node(prefix)
         return node is not None
     
+    # Cursor API: step one letter at a time from self.root instead of
+    # re-walking the whole prefix on every lookup.
+    def child(self, node: TrieNode, char: str) -> TrieNode | None:
+        return node.children.get(char)
+    
+    def is_terminal(self, node: TrieNode) -> bool:
+        return node.is_word
+    
+    def can_extend(self, node: TrieNode, missing_letters: int, free_cells: int) -> bool:
+        return node.min_depth <= free_cells and not node.letter_mask & missing_letters
+    
+    def max_depth(self, node: TrieNode) -> int:
+        return node.max_depth
+    
     def _find_node(self, prefix: str) -> TrieNode:
         node = self.root
         
@@ -0,0 +1,111 @@
+import queue
+import threading
+import time
+from typing import Callable, NamedTuple
+
+
+class Submission(NamedTuple):
+    board: str
+    total_score: int
+    results: list[tuple[str, int]]
+
+
+class WriterBusy(Exception):
+    pass
+
+
+# Background writer: the request path only enqueues, and a single thread
+# drains the bounded queue in batches of up to batch_size submissions, or
+# whatever arrived within flush_interval seconds. When the queue is full,
+# submit() blocks for up to put_timeout seconds and then raises WriterBusy.
+class BoardWriter:
+
+    def __init__(self, write_batch: Callable[[list[Submission]], None], max_queue: int = 1000,
+                 batch_size: int = 50, flush_interval: float = 0.5, put_timeout: float = 2.0):
+        self._write_batch = write_batch
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.put_timeout = put_timeout
+        self.written = 0
+        self.failed = 0
+        self._queue: queue.Queue = queue.Queue(max_queue)
+        self._thread: threading.Thread | None = None
+        self._lock = threading.Lock()
+        self._closed = False
+
+    # _closed is checked and the submission enqueued under the lock, so no
+    # submission can land behind close()'s sentinel. The wait for the lock
+    # counts against put_timeout.
+    def submit(self, board: str, total_score: int, results: list[tuple[str, int]]) -> None:
+        deadline = time.monotonic() + self.put_timeout
+        if not self._lock.acquire(timeout=self.put_timeout):
+            raise WriterBusy(f"write queue full ({self._queue.maxsize} pending)")
+        try:
+            if self._closed:
+                raise WriterBusy("writer is shut down")
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="board-writer", daemon=True)
+                self._thread.start()
+            self._queue.put(Submission(board, total_score, results),
+                            timeout=max(deadline - time.monotonic(), 0))
+        except queue.Full:
+            raise WriterBusy(f"write queue full ({self._queue.maxsize} pending)") from None
+        finally:
+            self._lock.release()
+
+    def pending(self) -> int:
+        return self._queue.qsize()
+
+    def flush(self) -> None:
+        if self._thread is not None:
+            self._queue.join()
+
+    def close(self, timeout: float | None = 30.0) -> None:
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            thread = self._thread
+        if thread is None:
+            return
+        deadline = None if timeout is None else time.monotonic() + timeout
+        try:
+            self._queue.put(None, timeout=timeout)
+        except queue.Full:
+            print(f"Board writer did not stop: {self._queue.qsize()} submissions still pending")
+            return
+        thread.join(None if deadline is None else max(deadline - time.monotonic(), 0))
+
+    def _run(self) -> None:
+        stopping = False
+        while not stopping:
+            item = self._queue.get()
+            batch = []
+            deadline = time.monotonic() + self.flush_interval
+            while True:
+                if item is None:
+                    stopping = True
+                else:
+                    batch.append(item)
+                if stopping or len(batch) >= self.batch_size:
+                    break
+                try:
+                    item = self._queue.get(timeout=max(deadline - time.monotonic(), 0))
+                except queue.Empty:
+                    break
+
+            if batch:
+                self._flush_batch(batch)
+            for _ in range(len(batch) + (1 if stopping else 0)):
+                self._queue.task_done()
+
+    def _flush_batch(self, batch: list[Submission]) -> None:
+        for attempt in range(2):
+            try:
+                self._write_batch(batch)
+                self.written += len(batch)
+                return
+            except Exception as e:
+                error = e
+        self.failed += len(batch)
+        print(f"Dropped {len(batch)} board submissions after write failure: {error}")
@@ -0,0 +1,38 @@
+# Parsed TrieMap against the memory-mapped CompiledTrie: load time, then
+# solve time per board on the same random boards.
+# Run from the repository root: python -m benchmarks.bench_compiled
+import os
+import tempfile
+import time
+
+from backend.compiled_trie import CompiledTrie, compile_dictionary
+from backend.solver import Solver, load_dictionary
+from benchmarks.bench_solver import random_boards, time_solver
+
+
+def main() -> None:
+    started = time.perf_counter()
+    trie = load_dictionary()
+    parse_time = time.perf_counter() - started
+    fd, path = tempfile.mkstemp(suffix=".bin")
+    os.close(fd)
+    compile_dictionary(trie, path)
+    started = time.perf_counter()
+    compiled = CompiledTrie(path)
+    map_time = time.perf_counter() - started
+    print(f"load: parse {parse_time * 1000:.0f} ms, mmap {map_time * 1000:.2f} ms")
+
+    print(f"{'board':>6} {'TrieMap':>10} {'compiled':>10} {'ratio':>6}")
+    for size, count in ((4, 200), (5, 100), (6, 50), (10, 5)):
+        boards = random_boards(size, count, seed=size)
+        trie_time, expected = time_solver(Solver(trie, prefilter="off"), boards)
+        compiled_time, results = time_solver(Solver(compiled, prefilter="off"), boards)
+        assert results == expected
+        print(f"{size}x{size:<4} {trie_time * 1000:>7.2f} ms {compiled_time * 1000:>7.2f} ms "
+              f"{compiled_time / trie_time:>5.2f}x")
+    compiled.close()
+    os.remove(path)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,22 @@
+# Compares the recursive and iterative solver engines on boards up to 10x10.
+# Run from the repository root: python -m benchmarks.bench_engines
+from backend.solver import Solver, load_dictionary
+from benchmarks.bench_solver import random_boards, time_solver
+
+
+def main() -> None:
+    dictionary = load_dictionary()
+    recursive = Solver(dictionary, engine="recursive")
+    iterative = Solver(dictionary, engine="iterative")
+    print(f"{'board':>6} {'recursive':>12} {'iterative':>12} {'ratio':>7}")
+    for size in range(4, 11):
+        boards = random_boards(size, max(2, 40 // size), seed=size)
+        recursive_time, expected = time_solver(recursive, boards)
+        iterative_time, results = time_solver(iterative, boards)
+        assert results == expected
+        print(f"{size}x{size:<4} {recursive_time * 1000:>9.2f} ms {iterative_time * 1000:>9.2f} ms "
+              f"{recursive_time / iterative_time:>6.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+# Rows per second loading (board, word, value) rows with execute_values versus
+# COPY through a staging table. Needs a Postgres reachable through the
+# WORDHUNT_DB_* settings; everything happens in temporary tables.
+# Run from the repository root: python -m benchmarks.bench_ingest [rows]
+import random
+import string
+import sys
+import time
+
+from psycopg2.extras import execute_values
+
+from backend.bulk import copy_rows
+from backend.database import ConnectionPool
+
+
+def fake_rows(count: int, seed: int = 17) -> list[tuple[str, str, int]]:
+    rng = random.Random(seed)
+    rows = []
+    while len(rows) < count:
+        board = "".join(rng.choices(string.ascii_lowercase, k=16))
+        for i in range(min(200, count - len(rows))):
+            word = "".join(rng.choices(string.ascii_lowercase, k=rng.randrange(3, 9))) + str(i)
+            rows.append((board, word, 100 * rng.randrange(1, 30)))
+    return rows
+
+
+def main() -> None:
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    rows = fake_rows(count)
+    pool = ConnectionPool()
+    with pool.connection() as conn:
+        cur = conn.cursor()
+        for table in ("bench_values_insert", "bench_copy"):
+            cur.execute(f'''
+            CREATE TEMP TABLE {table} (
+                board TEXT NOT NULL, word TEXT NOT NULL, value INTEGER NOT NULL,
+                PRIMARY KEY (board, word)
+            );
+            ''')
+
+        start = time.perf_counter()
+        execute_values(cur, '''
+        INSERT INTO bench_values_insert (board, word, value) VALUES %s
+        ON CONFLICT (board, word) DO NOTHING
+        ''', rows, page_size=1000)
+        conn.commit()
+        insert_elapsed = time.perf_counter() - start
+
+        start = time.perf_counter()
+        copy_rows(cur, "bench_copy", ("board", "word", "value"), rows)
+        conn.commit()
+        copy_elapsed = time.perf_counter() - start
+        cur.close()
+    pool.close()
+
+    print(f"{count} rows")
+    print(f"execute_values  {count / insert_elapsed:>12,.0f} rows/s")
+    print(f"COPY + merge    {count / copy_elapsed:>12,.0f} rows/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,35 @@
+# Board evaluations per second for one annealing chain (one core), on the
+# parsed TrieMap and on the compiled trie the Docker image serves.
+# Run from the repository root: python -m benchmarks.bench_optimizer
+import os
+import tempfile
+import time
+
+from backend.compiled_trie import CompiledTrie, compile_dictionary
+from backend.optimizer import anneal
+from backend.solver import Solver, load_dictionary
+
+
+def main() -> None:
+    trie = load_dictionary()
+    fd, path = tempfile.mkstemp(suffix=".bin")
+    os.close(fd)
+    compile_dictionary(trie, path)
+    compiled = CompiledTrie(path)
+
+    steps = 2000
+    print(f"{'board':>6} {'dictionary':>10} {'evaluations/s':>14} {'solves/s':>9} {'best':>7}")
+    for size in (4, 5):
+        for label, dictionary in (("TrieMap", trie), ("compiled", compiled)):
+            solver = Solver(dictionary, engine="iterative", prefilter="off")
+            started = time.perf_counter()
+            result = anneal(solver, size, steps, seed=size)
+            elapsed = time.perf_counter() - started
+            print(f"{size}x{size:<4} {label:>10} {result.evaluations / elapsed:>14,.0f} "
+                  f"{result.solves / elapsed:>9,.0f} {result.score:>7}")
+    compiled.close()
+    os.remove(path)
+
+
+if __name__ == "__main__":
+    main()
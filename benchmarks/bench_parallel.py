@@ -0,0 +1,34 @@
+# Scaling of ParallelSolver with the worker count against the sequential solver.
+# Run from the repository root: python -m benchmarks.bench_parallel
+import os
+
+from backend.parallel import ParallelSolver
+from backend.solver import Solver, get_dictionary
+from benchmarks.bench_solver import random_boards, time_solver
+
+
+def main() -> None:
+    sequential = Solver(get_dictionary())
+    worker_counts = sorted({1, 2, 4, os.cpu_count() or 1})
+    print(f"cpu_count={os.cpu_count()}")
+    print(f"{'board':>6} {'sequential':>12} " + " ".join(f"{f'{n} workers':>12}" for n in worker_counts))
+    solvers = {n: ParallelSolver(workers=n) for n in worker_counts}
+    try:
+        for size in (4, 6, 8, 10):
+            boards = random_boards(size, 8, seed=size)
+            baseline, expected = time_solver(sequential, boards)
+            timings = []
+            for n in worker_counts:
+                solvers[n].solve(boards[0])
+                elapsed, results = time_solver(solvers[n], boards)
+                assert results == expected
+                timings.append(elapsed)
+            print(f"{size}x{size:<4} {baseline * 1000:>9.2f} ms "
+                  + " ".join(f"{t * 1000:>9.2f} ms" for t in timings))
+    finally:
+        for solver in solvers.values():
+            solver.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,48 @@
+# When does searching a per-board pre-filtered trie beat searching the full
+# dictionary? Boards are drawn from alphabets of increasing size, from 4x4 up
+# to 13x13, where ordinary random boards must stay on the full trie.
+# Run from the repository root: python -m benchmarks.bench_prefilter
+import random
+import time
+
+from backend.board import Board
+from backend.prefilter import build_board_trie
+from backend.solver import Solver, load_dictionary
+from benchmarks.bench_solver import random_boards
+
+ALPHABETS = ["est", "aest", "aestr", "aeinrst", "aeilnorst"]
+
+
+def time_per_board(solver: Solver, boards: list[Board]) -> tuple[float, list]:
+    started = time.perf_counter()
+    results = [solver.solve(board) for board in boards]
+    return (time.perf_counter() - started) / len(boards), results
+
+
+def main() -> None:
+    dictionary = load_dictionary()
+    full = Solver(dictionary, prefilter="off")
+    filtered = Solver(dictionary, prefilter="on")
+    auto = Solver(dictionary, prefilter="auto")
+    rng = random.Random(0)
+
+    print(f"{'letters':>10} {'board':>6} {'full trie':>10} {'filtered':>10} {'build':>8} {'auto':>10}")
+    for size in (4, 5, 6, 8, 10, 13):
+        cases = [(alphabet, [Board("".join(rng.choice(alphabet) for _ in range(size * size)))
+                             for _ in range(3)]) for alphabet in ALPHABETS]
+        cases.append(("random", random_boards(size, 3, seed=size)))
+        for label, boards in cases:
+            full_time, expected = time_per_board(full, boards)
+            filtered_time, results = time_per_board(filtered, boards)
+            auto_time, auto_results = time_per_board(auto, boards)
+            assert results == expected and auto_results == expected
+            started = time.perf_counter()
+            for board in boards:
+                build_board_trie(dictionary, board)
+            build_time = (time.perf_counter() - started) / len(boards)
+            print(f"{label:>10} {size}x{size:<4} {full_time * 1000:>7.2f} ms {filtered_time * 1000:>7.2f} ms "
+                  f"{build_time * 1000:>5.2f} ms {auto_time * 1000:>7.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,47 @@
+# Trie nodes visited per solve with and without the subtree letter-mask and
+# depth pruning. Run from the repository root: python -m benchmarks.bench_pruning
+import time
+
+from backend.solver import Solver, load_dictionary
+from benchmarks.bench_solver import random_boards
+
+
+# Same dictionary, but every branch looks extendable, i.e. the solver as it
+# was before the annotations existed.
+class UnprunedDictionary:
+
+    def __init__(self, dictionary):
+        self.root = dictionary.root
+        self.child = dictionary.child
+        self.is_terminal = dictionary.is_terminal
+
+    def can_extend(self, node, missing_letters: int, free_cells: int) -> bool:
+        return True
+
+
+def measure(solver: Solver, boards) -> tuple[float, float, list]:
+    visited = 0
+    results = []
+    started = time.perf_counter()
+    for board in boards:
+        results.append(solver.solve(board))
+        visited += solver.nodes_visited
+    return visited / len(boards), (time.perf_counter() - started) / len(boards), results
+
+
+def main() -> None:
+    dictionary = load_dictionary()
+    pruned = Solver(dictionary, prefilter="off")
+    unpruned = Solver(UnprunedDictionary(dictionary), prefilter="off")
+    print(f"{'board':>6} {'nodes before':>13} {'nodes after':>12} {'cut':>6} {'time before':>12} {'time after':>11}")
+    for size in (4, 5, 6, 8):
+        boards = random_boards(size, 20, seed=size)
+        before_nodes, before_time, expected = measure(unpruned, boards)
+        after_nodes, after_time, results = measure(pruned, boards)
+        assert results == expected
+        print(f"{size}x{size:<4} {before_nodes:>13.0f} {after_nodes:>12.0f} {1 - after_nodes / before_nodes:>6.1%} "
+              f"{before_time * 1000:>9.2f} ms {after_time * 1000:>8.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,37 @@
+# Score-only path against a full solve: Solver.score(board) versus
+# get_total_score(solve(board)) on random boards, plus peak memory per call.
+# Run from the repository root: python -m benchmarks.bench_score
+import time
+import tracemalloc
+
+from backend.solver import Solver, get_dictionary
+from benchmarks.bench_solver import random_boards
+
+
+def main() -> None:
+    solver = Solver(get_dictionary(), engine="iterative", prefilter="off")
+    print(f"{'board':>6} {'solve+total':>12} {'score':>12} {'speedup':>8} {'peak (solve)':>13} {'peak (score)':>13}")
+    for size, count in ((4, 200), (5, 100), (6, 50), (8, 10), (10, 3)):
+        boards = random_boards(size, count, seed=size)
+        started = time.perf_counter()
+        for board in boards:
+            solver.get_total_score(solver.solve(board))
+        solve_time = (time.perf_counter() - started) / count
+
+        started = time.perf_counter()
+        for board in boards:
+            solver.score(board)
+        score_time = (time.perf_counter() - started) / count
+
+        peaks = []
+        for run in (lambda b: solver.get_total_score(solver.solve(b)), solver.score):
+            tracemalloc.start()
+            run(boards[0])
+            peaks.append(tracemalloc.get_traced_memory()[1])
+            tracemalloc.stop()
+        print(f"{size}x{size:<4} {solve_time * 1000:>9.2f} ms {score_time * 1000:>9.2f} ms "
+              f"{solve_time / score_time:>7.2f}x {peaks[0] / 1024:>10.1f} KB {peaks[1] / 1024:>10.1f} KB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,44 @@
+# Cost of a single-letter edit: SolverSession.set_cell against solving the
+# edited board from scratch. Run from the repository root:
+#   python -m benchmarks.bench_session
+import random
+import time
+
+from backend.board import Board
+from backend.generator import LETTER_WEIGHTS
+from backend.session import SolverSession
+from backend.solver import Solver, get_dictionary
+from benchmarks.bench_solver import random_boards
+
+
+def main() -> None:
+    dictionary = get_dictionary()
+    solver = Solver(dictionary, prefilter="off")
+    rng = random.Random(22)
+    edits = 50
+    letters, weights = zip(*LETTER_WEIGHTS.items())
+    print(f"{'board':>6} {'full solve':>12} {'set_cell':>12} {'nodes (full)':>13} {'nodes (edit)':>13}")
+    for size in (4, 5, 6, 8):
+        board = random_boards(size, 1, seed=size)[0]
+        session = SolverSession(dictionary, board)
+        full_nodes = session.nodes_visited
+        edit_time = solve_time = 0.0
+        edit_nodes = 0
+        for _ in range(edits):
+            letter = rng.choices(letters, weights)[0]
+            row, col = rng.randrange(size), rng.randrange(size)
+
+            started = time.perf_counter()
+            session.set_cell(row, col, letter)
+            edit_time += time.perf_counter() - started
+            edit_nodes += session.nodes_visited
+
+            started = time.perf_counter()
+            solver.solve(Board("".join(board.letters)))
+            solve_time += time.perf_counter() - started
+        print(f"{size}x{size:<4} {solve_time / edits * 1000:>9.2f} ms {edit_time / edits * 1000:>9.2f} ms "
+              f"{full_nodes:>13} {edit_nodes // edits:>13}")
+
+
+if __name__ == "__main__":
+    main()
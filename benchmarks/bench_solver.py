@@ -0,0 +1,57 @@
+# Compares the current solver with the original prefix-walking DFS.
+# Run from the repository root: python -m benchmarks.bench_solver
+import time
+
+from backend.board import Board
+from backend.generator import generate_grids
+from backend.solver import Solver, load_dictionary
+
+
+def random_boards(size: int, count: int, seed: int = 0) -> list[Board]:
+    return [Board(grid) for grid in generate_grids(size, count, seed)]
+
+
+# The solver as it was before the cursor API: every step re-walks the
+# prefix from the root twice and builds a new string.
+class PrefixWalkSolver(Solver):
+
+    def solve(self, board: Board) -> list[tuple[str, int]]:
+        self.found_words.clear()
+        for row in range(board.rows):
+            for col in range(board.cols):
+                self._prefix_dfs(board, row, col, set(), "")
+        words_with_scores = [(word, self._calculate_score(word)) for word in self.found_words]
+        words_with_scores.sort(key=lambda x: (-x[1], x[0]))
+        return words_with_scores
+
+    def _prefix_dfs(self, board: Board, row: int, col: int, visited: set, current_word: str) -> None:
+        current_word += board.get_letter(row, col)
+        visited.add((row, col))
+        if self.dictionary.starts_with(current_word):
+            if len(current_word) >= 3 and self.dictionary.search(current_word):
+                self.found_words.add(current_word)
+            for new_row, new_col in board.get_neighbors(row, col):
+                if (new_row, new_col) not in visited:
+                    self._prefix_dfs(board, new_row, new_col, visited, current_word)
+        visited.remove((row, col))
+
+
+def time_solver(solver: Solver, boards: list[Board]) -> tuple[float, list]:
+    started = time.perf_counter()
+    results = [solver.solve(board) for board in boards]
+    return (time.perf_counter() - started) / len(boards), results
+
+
+def main() -> None:
+    dictionary = load_dictionary()
+    print(f"{'board':>6} {'prefix walk':>14} {'solver':>12} {'speedup':>8}")
+    for size, count in ((4, 50), (5, 20), (6, 10), (8, 5)):
+        boards = random_boards(size, count, seed=size)
+        baseline, expected = time_solver(PrefixWalkSolver(dictionary), boards)
+        current, results = time_solver(Solver(dictionary), boards)
+        assert results == expected
+        print(f"{size}x{size:<4} {baseline * 1000:>11.2f} ms {current * 1000:>9.2f} ms {baseline / current:>7.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,45 @@
+# End-to-end request throughput against the embedded SQLite storage, with no
+# network involved. Run from the repository root:
+#   python -m benchmarks.bench_storage [requests]
+import os
+import sys
+import tempfile
+import time
+
+from benchmarks.bench_solver import random_boards
+
+
+def main() -> None:
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+    with tempfile.TemporaryDirectory() as tmp:
+        os.environ["WORDHUNT_STORAGE"] = f"sqlite:{os.path.join(tmp, 'bench.db')}"
+        import wordhunt_app
+
+        client = wordhunt_app.app.test_client()
+        grids = ["".join(board.letters) for board in random_boards(4, count, seed=15)]
+
+        start = time.perf_counter()
+        for grid in grids:
+            client.post("/", data={"input_grid": grid})
+        solve_elapsed = time.perf_counter() - start
+
+        start = time.perf_counter()
+        wordhunt_app.board_writer.flush()
+        drain_elapsed = time.perf_counter() - start
+
+        start = time.perf_counter()
+        pages = 0
+        for lengths in ([], [3], [4, 5], [6, 7, 8]):
+            client.get("/records", query_string={"length": lengths})
+            pages += 1
+        records_elapsed = time.perf_counter() - start
+
+        print(f"{count} POST /          {count / solve_elapsed:>8.1f} req/s")
+        print(f"writer drain after   {drain_elapsed * 1000:>8.1f} ms")
+        print(f"GET /records         {records_elapsed / pages * 1000:>8.2f} ms/page")
+        wordhunt_app.board_writer.close()
+        wordhunt_app.storage.close()
+
+
+if __name__ == "__main__":
+    main()
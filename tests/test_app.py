@@ -0,0 +1,263 @@
+import json
+import os
+import tempfile
+import unittest
+import wordhunt_app
+from backend.database import ConnectionPool
+from backend.board import Board
+from backend.ranking import ScoreIndex
+from backend.solver import get_solve_cache
+from backend.storage import PostgresStorage, SqliteStorage
+from backend.writer import Submission, WriterBusy
+
+
+class TestIndexView(unittest.TestCase):
+    
+    def setUp(self):
+        self.connects = 0
+        
+        def connect():
+            self.connects += 1
+            raise AssertionError("the database should not be touched")
+        
+        self.original_storage = wordhunt_app.storage
+        wordhunt_app.storage = PostgresStorage(ConnectionPool(connect))
+        # A warm process: the score index was loaded by an earlier request
+        wordhunt_app.storage.score_index.loaded = True
+        self.client = wordhunt_app.app.test_client()
+    
+    def tearDown(self):
+        wordhunt_app.storage = self.original_storage
+    
+    def test_get_does_not_connect(self):
+        response = self.client.get('/')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(self.connects, 0)
+    
+    def test_post_without_words_does_not_connect(self):
+        response = self.client.post('/', data={'input_grid': 'qqqqqqqqqqqqqqqq'})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(self.connects, 0)
+    
+    def test_percentile_comes_from_score_index(self):
+        submitted = []
+        storage = wordhunt_app.storage
+        storage.score_index = ScoreIndex([('a' * 16, 100), ('b' * 16, 100000)])
+        storage.score_index.loaded = True
+        original_writer = wordhunt_app.board_writer
+        wordhunt_app.board_writer = type('Writer', (), {'submit': lambda self, *args: submitted.append(args)})()
+        try:
+            response = self.client.post('/', data={'input_grid': 'catsdogsbirdfish'})
+        finally:
+            wordhunt_app.board_writer = original_writer
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(self.connects, 0)
+        self.assertEqual(len(submitted), 1)
+        # Not known until the writer has stored it
+        self.assertEqual(storage.score_index.total, 2)
+        self.assertNotIn('catsdogsbirdfish', storage.score_index)
+    
+    def test_board_dropped_by_busy_writer_is_resubmitted(self):
+        submitted = []
+        
+        def busy(self, *args):
+            submitted.append(args)
+            raise WriterBusy()
+        
+        storage = wordhunt_app.storage
+        storage.score_index = ScoreIndex([('a' * 16, 100)])
+        storage.score_index.loaded = True
+        original_writer = wordhunt_app.board_writer
+        wordhunt_app.board_writer = type('Writer', (), {'submit': busy})()
+        try:
+            for _ in range(2):
+                response = self.client.post('/', data={'input_grid': 'catsdogsbirdfish'})
+                self.assertEqual(response.status_code, 200)
+        finally:
+            wordhunt_app.board_writer = original_writer
+        self.assertEqual(len(submitted), 2)
+        self.assertFalse(storage.is_known('catsdogsbirdfish'))
+    
+    def test_solve_api_pages_words_by_length(self):
+        results, total_score = wordhunt_app.web_solver('catsdogsbirdfish')
+        pages, cursor = [], None
+        while True:
+            response = self.client.get('/api/solve', query_string={
+                'grid': 'catsdogsbirdfish', 'limit': 7, **({'cursor': cursor} if cursor else {})})
+            self.assertEqual(response.status_code, 200)
+            page = response.get_json()
+            pages.append(page)
+            cursor = page['next_cursor']
+            if cursor is None:
+                break
+        
+        self.assertEqual(pages[0]['total_score'], total_score)
+        self.assertEqual(pages[0]['word_count'], len(results))
+        self.assertEqual(sum(pages[0]['histogram'].values()), len(results))
+        self.assertEqual(len(pages), (len(results) + 6) // 7)
+        paged = []
+        for page in pages:
+            for length, words in sorted(page['words'].items(), key=lambda item: -int(item[0])):
+                self.assertTrue(all(len(word) == int(length) for word in words))
+                paged += [(word, wordhunt_app.score_for_length(len(word))) for word in words]
+        self.assertEqual(paged, results)
+        self.assertEqual(self.connects, 0)
+    
+    def test_deadline_returns_partial_results(self):
+        grid = 'aeiourstlnmdcpbgh' * 6
+        submitted = []
+        original_writer = wordhunt_app.board_writer
+        wordhunt_app.board_writer = type('Writer', (), {'submit': lambda self, *args: submitted.append(args)})()
+        try:
+            page = self.client.post('/', data={'input_grid': grid[:100], 'deadline_ms': '0'})
+        finally:
+            wordhunt_app.board_writer = original_writer
+        self.assertIn('results are partial', page.get_data(as_text=True))
+        self.assertEqual(submitted, [])
+        
+        response = self.client.get('/api/solve', query_string={'grid': grid[:100], 'deadline_ms': 0})
+        body = response.get_json()
+        self.assertTrue(body['partial'])
+        self.assertLess(body['cells_covered'], 100)
+        self.assertIsNone(get_solve_cache().lookup(Board(grid[:100])))
+        self.assertEqual(self.connects, 0)
+        
+        response = self.client.get('/api/solve/stream', query_string={'grid': grid[:100], 'deadline_ms': 0})
+        done = json.loads(response.get_data(as_text=True).strip().split('\n\n')[-1].split('\n')[1][len('data: '):])
+        self.assertTrue(done['partial'])
+        self.assertLess(done['cells_covered'], 100)
+    
+    def test_full_write_queue_still_renders_results(self):
+        def submit(*args):
+            raise WriterBusy('write queue full (1000 pending)')
+        
+        wordhunt_app.storage.score_index = ScoreIndex([('a' * 16, 100)])
+        wordhunt_app.storage.score_index.loaded = True
+        original_writer = wordhunt_app.board_writer
+        wordhunt_app.board_writer = type('Writer', (), {'submit': lambda self, *args: submit(*args)})()
+        try:
+            response = self.client.post('/', data={'input_grid': 'catsdogsbirdfish'})
+        finally:
+            wordhunt_app.board_writer = original_writer
+        self.assertEqual(response.status_code, 200)
+        results, _ = wordhunt_app.web_solver('catsdogsbirdfish')
+        self.assertIn(results[0][0].upper(), response.get_data(as_text=True))
+    
+    def test_solve_api_rejects_bad_grids(self):
+        self.assertEqual(self.client.get('/api/solve').status_code, 400)
+        response = self.client.post('/api/solve', json={'grid': 'abc'})
+        self.assertEqual(response.status_code, 400)
+        self.assertIn('error', response.get_json())
+    
+    def test_solve_api_rejects_malformed_json(self):
+        for body in ({'grid': 123}, {'cursor': 5}, {'grid': 'catsdogsbirdfish', 'cursor': 5},
+                     ['catsdogsbirdfish'], {'grid': 'catsdogsbirdfish', 'limit': [1]}):
+            response = self.client.post('/api/solve', json=body)
+            self.assertEqual(response.status_code, 400, body)
+            self.assertIn('error', response.get_json())
+    
+    def test_solve_stream_sends_running_totals(self):
+        results, total_score = wordhunt_app.web_solver('catsdogsbirdfish')
+        response = self.client.get('/api/solve/stream', query_string={'grid': 'catsdogsbirdfish'})
+        self.assertEqual(response.mimetype, 'text/event-stream')
+        events = []
+        for block in response.get_data(as_text=True).strip().split('\n\n'):
+            name, data = block.split('\n')
+            events.append((name[len('event: '):], json.loads(data[len('data: '):])))
+        
+        self.assertEqual(events[-1], ('done', {'total_score': total_score, 'word_count': len(results),
+                                               'partial': False, 'cells_covered': 16}))
+        streamed, running = [], 0
+        for name, data in events[:-1]:
+            self.assertEqual(name, 'words')
+            streamed += [tuple(word) for word in data['words']]
+            running += sum(score for _, score in data['words'])
+            self.assertEqual(data['total_score'], running)
+            self.assertEqual(data['word_count'], len(streamed))
+        self.assertEqual(len(events[0][1]['words']), 1)
+        self.assertEqual(sorted(streamed, key=lambda x: (-x[1], x[0])), results)
+        self.assertEqual(self.client.get('/api/solve/stream', query_string={'grid': 'abc'}).status_code, 400)
+    
+    def test_batch_solve_streams_one_line_per_board(self):
+        body = 'catsdogsbirdfish\n\n{"grid": "tearsoninglepast"}\nabc\n{"board": "x"}\n'
+        response = self.client.post('/api/solve/batch', data=body)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.mimetype, 'application/x-ndjson')
+        lines = [json.loads(line) for line in response.get_data(as_text=True).splitlines()]
+        
+        self.assertEqual([line['line'] for line in lines], [1, 3, 4, 5])
+        for line, grid in zip(lines, ['catsdogsbirdfish', 'tearsoninglepast']):
+            results, total_score = wordhunt_app.web_solver(grid)
+            self.assertEqual(line['grid'], grid)
+            self.assertEqual(line['total_score'], total_score)
+            self.assertEqual([tuple(word) for word in line['words']], results)
+        self.assertIn('error', lines[2])
+        self.assertIn('error', lines[3])
+        self.assertEqual(self.connects, 0)
+
+
+class TestSqliteEndToEnd(unittest.TestCase):
+    
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.original_storage = wordhunt_app.storage
+        wordhunt_app.storage = SqliteStorage(os.path.join(self.tmp.name, 'wordhunt.db'))
+        self.client = wordhunt_app.app.test_client()
+    
+    def tearDown(self):
+        wordhunt_app.board_writer.flush()
+        wordhunt_app.storage.close()
+        wordhunt_app.storage = self.original_storage
+        self.tmp.cleanup()
+    
+    def test_solved_boards_reach_the_leaderboard(self):
+        for grid in ('catsdogsbirdfish', 'tearsoninglepast'):
+            response = self.client.post('/', data={'input_grid': grid})
+            self.assertEqual(response.status_code, 200)
+        wordhunt_app.board_writer.flush()
+        
+        page = self.client.get('/records').get_data(as_text=True)
+        self.assertIn('Showing 1-2 of 2 boards', page)
+        self.assertIn('CATS', page)
+    
+    def test_capped_total_is_shown_as_a_lower_bound(self):
+        wordhunt_app.storage.record_submissions([Submission(f'board{i:03}', 100, [('cat', 100)])
+                                                 for i in range(201)])
+        page = self.client.get('/records').get_data(as_text=True)
+        self.assertIn('Showing 1-20 of 200+ boards', page)
+    
+    def test_known_board_skips_solve_and_insert(self):
+        first = self.client.post('/', data={'input_grid': 'catsdogsbirdfish'}).get_data(as_text=True)
+        wordhunt_app.board_writer.flush()
+        
+        submitted = []
+        original_solver, original_writer = wordhunt_app.web_solve, wordhunt_app.board_writer
+        wordhunt_app.web_solve = lambda *args: self.fail('known boards should not be solved')
+        wordhunt_app.board_writer = type('Writer', (), {'submit': lambda self, *args: submitted.append(args)})()
+        try:
+            second = self.client.post('/', data={'input_grid': 'catsdogsbirdfish'}).get_data(as_text=True)
+        finally:
+            wordhunt_app.web_solve, wordhunt_app.board_writer = original_solver, original_writer
+        self.assertEqual(submitted, [])
+        self.assertEqual(second, first)
+    
+    def test_known_board_is_recognized_after_a_cold_start(self):
+        results, total_score = wordhunt_app.web_solver('catsdogsbirdfish')
+        wordhunt_app.storage.record_submissions([Submission('catsdogsbirdfish', total_score, results)])
+        wordhunt_app.storage.close()
+        wordhunt_app.storage = SqliteStorage(os.path.join(self.tmp.name, 'wordhunt.db'))
+        
+        submitted = []
+        original_solver, original_writer = wordhunt_app.web_solve, wordhunt_app.board_writer
+        wordhunt_app.web_solve = lambda *args: self.fail('known boards should not be solved')
+        wordhunt_app.board_writer = type('Writer', (), {'submit': lambda self, *args: submitted.append(args)})()
+        try:
+            response = self.client.post('/', data={'input_grid': 'catsdogsbirdfish'})
+        finally:
+            wordhunt_app.web_solve, wordhunt_app.board_writer = original_solver, original_writer
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(submitted, [])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,39 @@
+import unittest
+from backend.board import Board, neighbor_table
+
+
+class TestBoard(unittest.TestCase):
+    
+    def test_dimensions_and_letters(self):
+        board = Board("ABCD efgh ijkl mnop")
+        self.assertEqual((board.rows, board.cols), (4, 4))
+        self.assertEqual(board.letters, list("abcdefghijklmnop"))
+        self.assertEqual(board.get_letter(1, 2), "g")
+        self.assertIsNone(board.get_letter(4, 0))
+    
+    def test_invalid_size(self):
+        with self.assertRaises(ValueError):
+            Board("abcde")
+    
+    def test_get_neighbors(self):
+        board = Board("abcdefghi")
+        self.assertEqual(sorted(board.get_neighbors(0, 0)), [(0, 1), (1, 0), (1, 1)])
+        self.assertEqual(len(board.get_neighbors(1, 1)), 8)
+        self.assertEqual(sorted(board.get_neighbors(2, 1)), [(1, 0), (1, 1), (1, 2), (2, 0), (2, 2)])
+    
+    def test_neighbor_table_matches_neighbors(self):
+        board = Board("abcdefghijklmnopqrstuvwxy")
+        for row, col in board.get_all_positions():
+            expected = sorted(board.cell_id(r, c) for r, c in board.get_neighbors(row, col))
+            self.assertEqual(sorted(board.neighbors[board.cell_id(row, col)]), expected)
+    
+    def test_neighbor_table_cached_per_shape(self):
+        first = Board("abcdefghijklmnop")
+        second = Board("ponmlkjihgfedcba")
+        self.assertIs(first.neighbors, second.neighbors)
+        self.assertIs(first.neighbors, neighbor_table(4, 4))
+        self.assertIsNot(first.neighbors, Board("abcdefghi").neighbors)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,88 @@
+import unittest
+from contextlib import contextmanager
+from backend.bulk import copy_buffer, copy_rows, ingest_words
+
+
+class RecordingCursor:
+    
+    def __init__(self):
+        self.queries = []
+        self.params = []
+        self.copied = []
+        self.rowcount = 0
+    
+    def execute(self, query, params=None):
+        self.queries.append(" ".join(query.split()))
+        self.params.append(params)
+        if query.lstrip().startswith("INSERT") and self.copied:
+            self.rowcount = len(self.copied[-1].splitlines())
+    
+    def fetchone(self):
+        return ("board_length_scores",)
+    
+    def copy_expert(self, sql, file):
+        self.queries.append(sql)
+        self.params.append(None)
+        self.copied.append(file.read())
+    
+    def close(self):
+        pass
+
+
+class RecordingPool:
+    
+    def __init__(self):
+        self.cur = RecordingCursor()
+        self.commits = 0
+    
+    def cursor(self):
+        return self.cur
+    
+    @contextmanager
+    def connection(self):
+        yield self
+    
+    def commit(self):
+        self.commits += 1
+
+
+class TestCopyRows(unittest.TestCase):
+    
+    def test_copy_buffer_escapes_text_format(self):
+        buffer = copy_buffer([("board", "cat", 100), ("a\tb", "c\\d\ne", None)])
+        self.assertEqual(buffer.read(), "board\tcat\t100\na\\tb\tc\\\\d\\ne\t\\N\n")
+    
+    def test_copy_rows_stages_then_merges(self):
+        cur = RecordingCursor()
+        inserted = copy_rows(cur, "board_words", ("board", "word", "value"),
+                             [("b", "cat", 100), ("b", "cats", 400)])
+        self.assertEqual(inserted, 2)
+        self.assertEqual(cur.copied, ["b\tcat\t100\nb\tcats\t400\n"])
+        self.assertIn("CREATE TEMP TABLE IF NOT EXISTS board_words_staging", cur.queries[0])
+        self.assertEqual(cur.queries[1], "COPY board_words_staging (board, word, value) FROM STDIN")
+        self.assertIn("INSERT INTO board_words (board, word, value) SELECT board, word, value "
+                      "FROM board_words_staging ON CONFLICT DO NOTHING", cur.queries[2])
+        self.assertEqual(cur.queries[3], "TRUNCATE board_words_staging;")
+    
+    def test_ingest_words_commits_per_chunk(self):
+        pool = RecordingPool()
+        rows = ((f"b{i}", "cat", 100) for i in range(25))
+        self.assertEqual(ingest_words(pool, rows, chunk_rows=10), 25)
+        self.assertEqual(pool.commits, 3)
+        self.assertEqual([len(copied.splitlines()) for copied in pool.cur.copied], [10, 10, 5])
+    
+    def test_ingest_words_refreshes_board_totals(self):
+        pool = RecordingPool()
+        rows = [("b1", "cat", 100), ("b1", "cats", 400), ("b2", "dog", 100)]
+        ingest_words(pool, rows, chunk_rows=2)
+        refreshes = [(query, params) for query, params in zip(pool.cur.queries, pool.cur.params)
+                     if "FROM board_words WHERE board = ANY" in query]
+        self.assertEqual([params for _, params in refreshes], [(["b1"],), (["b1"],), (["b2"],), (["b2"],)])
+        self.assertTrue(refreshes[0][0].startswith("INSERT INTO board_values"))
+        self.assertIn("ON CONFLICT (board) DO UPDATE SET value = EXCLUDED.value", refreshes[0][0])
+        self.assertTrue(refreshes[1][0].startswith("INSERT INTO board_length_scores"))
+        self.assertIn("total_score = EXCLUDED.total_score", refreshes[1][0])
+
+
+if __name__ == '__main__':
+    unittest.main()
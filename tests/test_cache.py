@@ -0,0 +1,103 @@
+import unittest
+from backend.board import Board
+from backend.cache import SolveCache, board_symmetries, canonical_board
+from backend.solver import Solver
+from backend.trie import TrieMap
+
+
+def rotate(grid: str, size: int) -> str:
+    return "".join(grid[(size - 1 - c) * size + r] for r in range(size) for c in range(size))
+
+
+def mirror(grid: str, size: int) -> str:
+    return "".join(grid[r * size + (size - 1 - c)] for r in range(size) for c in range(size))
+
+
+class TestCanonicalBoard(unittest.TestCase):
+    
+    def test_symmetry_counts(self):
+        self.assertEqual(len(board_symmetries(4, 4)), 8)
+        self.assertEqual(len(board_symmetries(2, 3)), 4)
+        self.assertEqual(len(set(board_symmetries(5, 5))), 8)
+    
+    def test_all_symmetries_share_canonical_form(self):
+        grid = "catdogefghijklmn"
+        expected = canonical_board(Board(grid))
+        for _ in range(4):
+            grid = rotate(grid, 4)
+            self.assertEqual(canonical_board(Board(grid)), expected)
+            self.assertEqual(canonical_board(Board(mirror(grid, 4))), expected)
+    
+    def test_different_boards_differ(self):
+        self.assertNotEqual(canonical_board(Board("catdogefghijklmn")),
+                            canonical_board(Board("catdogefghijklnm")))
+
+
+class TestSolveCache(unittest.TestCase):
+    
+    def setUp(self):
+        self.dictionary = TrieMap()
+        self.dictionary.load_from_list(["cat", "dog", "act", "god", "tad", "cod"])
+        self.calls = 0
+        
+        def solve(board):
+            self.calls += 1
+            return Solver(self.dictionary).solve(board)
+        
+        self.cache = SolveCache(solve, maxsize=2)
+    
+    def test_hit_for_rotated_board(self):
+        grid = "catdogxyz"
+        first = self.cache.solve(Board(grid))
+        second = self.cache.solve(Board(rotate(grid, 3)))
+        third = self.cache.solve(Board(mirror(grid, 3)))
+        
+        self.assertEqual(first, Solver(self.dictionary).solve(Board(grid)))
+        self.assertEqual(second, first)
+        self.assertEqual(third, first)
+        self.assertEqual(self.calls, 1)
+        self.assertEqual(self.cache.stats()["hits"], 2)
+        self.assertEqual(self.cache.stats()["misses"], 1)
+    
+    def test_results_are_copies(self):
+        board = Board("catdogxyz")
+        self.cache.solve(board).clear()
+        self.assertGreater(len(self.cache.solve(board)), 0)
+    
+    def test_lru_eviction(self):
+        self.cache.solve(Board("catxxxxxx"))
+        self.cache.solve(Board("dogxxxxxx"))
+        self.cache.solve(Board("catxxxxxx"))
+        self.cache.solve(Board("tadxxxxxx"))
+        
+        stats = self.cache.stats()
+        self.assertEqual(stats["size"], 2)
+        self.assertEqual(stats["evictions"], 1)
+        
+        self.cache.solve(Board("catxxxxxx"))
+        self.assertEqual(self.calls, 3)
+        self.cache.solve(Board("dogxxxxxx"))
+        self.assertEqual(self.calls, 4)
+    
+    def test_lookup_and_store(self):
+        board = Board("catdogxyz")
+        self.assertIsNone(self.cache.lookup(board))
+        self.cache.store(board, [("cat", 100)])
+        self.assertEqual(self.cache.lookup(Board(rotate("catdogxyz", 3))), [("cat", 100)])
+        self.assertEqual(self.cache.solve(board), [("cat", 100)])
+        self.assertEqual(self.calls, 0)
+        self.assertEqual(self.cache.stats()["hits"], 2)
+        self.assertEqual(self.cache.stats()["misses"], 1)
+    
+    def test_clear(self):
+        self.cache.solve(Board("catxxxxxx"))
+        self.cache.clear()
+        self.assertEqual(self.cache.stats(), {"size": 0, "maxsize": 2, "hits": 0, "misses": 0, "evictions": 0})
+    
+    def test_invalid_size(self):
+        with self.assertRaises(ValueError):
+            SolveCache(Solver(self.dictionary).solve, maxsize=0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,149 @@
+import os
+import random
+import tempfile
+import unittest
+from backend.trie import TrieMap
+from backend.compiled_trie import CompiledTrie, compile_dictionary
+from backend.solver import Solver, load_dictionary
+from backend.board import Board
+
+
+class TestCompiledTrie(unittest.TestCase):
+
+    def setUp(self):
+        self.words = ["cat", "catalog", "category", "dog", "dogma", "bat", "rat", "zebra"]
+        self.trie = TrieMap()
+        self.trie.load_from_list(self.words)
+
+        fd, self.path = tempfile.mkstemp(suffix=".bin")
+        os.close(fd)
+        compile_dictionary(self.trie, self.path)
+        self.compiled = CompiledTrie(self.path)
+
+    def tearDown(self):
+        self.compiled.close()
+        os.remove(self.path)
+
+    def test_counts(self):
+        self.assertEqual(self.compiled.size, self.trie.size)
+        self.assertEqual(self.compiled.node_count, self.trie.node_count)
+
+    def test_search_matches_trie(self):
+        probes = self.words + ["", "ca", "cata", "catt", "dogm", "zebras", "CAT", "caté", "x"]
+        for probe in probes:
+            self.assertEqual(self.compiled.search(probe), self.trie.search(probe), probe)
+
+    def test_starts_with_matches_trie(self):
+        probes = ["", "c", "ca", "cat", "categor", "catx", "d", "dogmas", "z", "q", "é"]
+        for probe in probes:
+            self.assertEqual(self.compiled.starts_with(probe), self.trie.starts_with(probe), probe)
+
+    def test_cursor_matches_trie(self):
+        for word in self.words:
+            node, compiled_node = self.trie.root, self.compiled.root
+            for char in word:
+                node = self.trie.child(node, char)
+                compiled_node = self.compiled.child(compiled_node, char)
+                self.assertEqual(self.compiled.is_terminal(compiled_node), self.trie.is_terminal(node))
+            self.assertIsNone(self.compiled.child(compiled_node, "q"))
+
+    def test_annotations_match_trie(self):
+        for word in self.words:
+            node, compiled_node = self.trie.root, self.compiled.root
+            for char in word:
+                node = self.trie.child(node, char)
+                compiled_node = self.compiled.child(compiled_node, char)
+                self.assertEqual(self.compiled.max_depth(compiled_node), self.trie.max_depth(node))
+                for missing in (0, 1 << 4, 1 << 19, (1 << 26) - 1):
+                    for free_cells in (0, 2, 5):
+                        self.assertEqual(self.compiled.can_extend(compiled_node, missing, free_cells),
+                                         self.trie.can_extend(node, missing, free_cells))
+
+    def test_characters_outside_a_to_z(self):
+        trie = TrieMap()
+        for word in ("o'clock", "ocelot", "1st", "a1b", "abc"):
+            trie.insert(word)
+        fd, path = tempfile.mkstemp(suffix=".bin")
+        os.close(fd)
+        try:
+            compile_dictionary(trie, path)
+            compiled = CompiledTrie(path)
+            for probe in ("o'clock", "ocelot", "1st", "a1b", "abc", "o'c", "ab1", "oc"):
+                self.assertEqual(compiled.search(probe), trie.search(probe), probe)
+                self.assertEqual(compiled.starts_with(probe), trie.starts_with(probe), probe)
+            compiled.close()
+        finally:
+            os.remove(path)
+
+    def test_empty_dictionary(self):
+        fd, path = tempfile.mkstemp(suffix=".bin")
+        os.close(fd)
+        try:
+            compile_dictionary(TrieMap(), path)
+            compiled = CompiledTrie(path)
+            self.assertEqual(compiled.size, 0)
+            self.assertTrue(compiled.starts_with(""))
+            self.assertFalse(compiled.search("cat"))
+            compiled.close()
+        finally:
+            os.remove(path)
+
+    def test_rejects_other_files(self):
+        with tempfile.NamedTemporaryFile(mode='wb', suffix=".bin", delete=False) as f:
+            f.write(b"not a trie" * 10)
+            path = f.name
+        try:
+            with self.assertRaises(ValueError):
+                CompiledTrie(path)
+        finally:
+            os.remove(path)
+
+    def test_load_dictionary_uses_compiled_file(self):
+        dictionary = load_dictionary(self.path)
+        self.assertIsInstance(dictionary, CompiledTrie)
+        self.assertTrue(dictionary.search("dogma"))
+        dictionary.close()
+
+    def test_solver_results_match(self):
+        board = Board("catdogrxbaxxzebr")
+        expected = Solver(self.trie).solve(board)
+        self.assertEqual(Solver(self.compiled).solve(board), expected)
+
+    def test_score_matches(self):
+        board = Board("catdogrxbaxxzebr")
+        self.assertEqual(Solver(self.compiled).score(board), Solver(self.trie).score(board))
+
+
+class TestCompiledFullDictionary(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.trie = load_dictionary()
+        fd, cls.path = tempfile.mkstemp(suffix=".bin")
+        os.close(fd)
+        compile_dictionary(cls.trie, cls.path)
+        cls.compiled = CompiledTrie(cls.path)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.compiled.close()
+        os.remove(cls.path)
+
+    def test_every_word_and_prefix(self):
+        self.assertEqual(self.compiled.size, self.trie.size)
+        rng = random.Random(7)
+        stack = [("", self.trie.root)]
+        while stack:
+            prefix, node = stack.pop()
+            self.assertTrue(self.compiled.starts_with(prefix), prefix)
+            self.assertEqual(self.compiled.search(prefix), node.is_word, prefix)
+            for char, child in node.children.items():
+                stack.append((prefix + char, child))
+            if rng.random() < 0.05:
+                probe = prefix + rng.choice("abcdefghijklmnopqrstuvwxyz")
+                self.assertEqual(self.compiled.starts_with(probe), self.trie.starts_with(probe), probe)
+                self.assertEqual(self.compiled.search(probe), self.trie.search(probe), probe)
+
+
+if __name__ == '__main__':
+    unittest.main()
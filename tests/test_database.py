@@ -0,0 +1,140 @@
+import threading
+import unittest
+import psycopg2
+from backend.database import ConnectionPool, PoolTimeout
+
+
+class FakeCursor:
+    
+    def __init__(self, conn):
+        self.conn = conn
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *exc_info):
+        pass
+    
+    def execute(self, query, params=None):
+        if self.conn.broken:
+            raise psycopg2.OperationalError("server closed the connection unexpectedly")
+        self.conn.queries.append(query)
+    
+    def fetchone(self):
+        return (1,)
+
+
+class FakeConnection:
+    
+    def __init__(self):
+        self.closed = 0
+        self.broken = False
+        self.queries = []
+        self.rollbacks = 0
+    
+    def cursor(self):
+        return FakeCursor(self)
+    
+    def rollback(self):
+        if self.broken:
+            raise psycopg2.OperationalError("server closed the connection unexpectedly")
+        self.rollbacks += 1
+    
+    def close(self):
+        self.closed = 1
+
+
+class TestConnectionPool(unittest.TestCase):
+    
+    def setUp(self):
+        self.connections = []
+        
+        def connect():
+            conn = FakeConnection()
+            self.connections.append(conn)
+            return conn
+        
+        self.pool = ConnectionPool(connect, max_connections=2, health_check_interval=0.0,
+                                   checkout_timeout=0.05)
+    
+    def test_connects_lazily(self):
+        self.assertEqual(self.connections, [])
+        with self.pool.connection():
+            pass
+        self.assertEqual(len(self.connections), 1)
+    
+    def test_reuses_connection(self):
+        with self.pool.connection() as first:
+            pass
+        with self.pool.connection() as second:
+            pass
+        self.assertIs(first, second)
+        self.assertEqual(self.pool.opened, 1)
+        self.assertIn("SELECT 1", second.queries)
+    
+    def test_rolls_back_on_checkin(self):
+        with self.assertRaises(ValueError):
+            with self.pool.connection() as conn:
+                raise ValueError("boom")
+        self.assertGreaterEqual(conn.rollbacks, 1)
+        self.assertFalse(conn.closed)
+    
+    def test_unhealthy_connection_replaced(self):
+        with self.pool.connection() as first:
+            pass
+        first.broken = True
+        with self.pool.connection() as second:
+            pass
+        self.assertIsNot(first, second)
+        self.assertTrue(first.closed)
+    
+    def test_operational_error_discards_connection(self):
+        with self.assertRaises(psycopg2.OperationalError):
+            with self.pool.connection() as conn:
+                conn.broken = True
+                conn.cursor().execute("SELECT 1")
+        self.assertTrue(conn.closed)
+        with self.pool.connection() as fresh:
+            self.assertIsNot(fresh, conn)
+    
+    def test_closed_connection_replaced(self):
+        with self.pool.connection() as first:
+            pass
+        first.closed = 2
+        with self.pool.connection() as second:
+            self.assertIsNot(second, first)
+    
+    def test_max_connections(self):
+        with self.pool.connection(), self.pool.connection():
+            with self.assertRaises(PoolTimeout):
+                with self.pool.connection():
+                    pass
+        with self.pool.connection():
+            pass
+    
+    def test_threads_share_pool(self):
+        seen = []
+        
+        def worker():
+            for _ in range(20):
+                with self.pool.connection() as conn:
+                    seen.append(conn)
+        
+        threads = [threading.Thread(target=worker) for _ in range(4)]
+        self.pool.checkout_timeout = 5
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(len(seen), 80)
+        self.assertLessEqual(self.pool.opened, 2)
+    
+    def test_close(self):
+        with self.pool.connection() as conn:
+            pass
+        self.pool.close()
+        self.assertTrue(conn.closed)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,40 @@
+import random
+import unittest
+from backend.generator import DICE, LETTER_WEIGHTS, generate_grids, random_grid
+
+
+class TestGenerator(unittest.TestCase):
+    
+    def test_frequency_grids(self):
+        grids = list(generate_grids(5, 20, seed=1))
+        self.assertEqual(len(grids), 20)
+        for grid in grids:
+            self.assertEqual(len(grid), 25)
+            self.assertTrue(set(grid) <= set(LETTER_WEIGHTS))
+    
+    def test_dice_grids(self):
+        rng = random.Random(2)
+        for size, dice in DICE.items():
+            self.assertEqual(len(dice), size * size)
+            for _ in range(20):
+                grid = random_grid(size, rng, mode="dice")
+                self.assertEqual(len(grid), size * size)
+                for letter in set(grid):
+                    self.assertLessEqual(grid.count(letter), sum(letter in die for die in dice))
+    
+    def test_same_seed_same_boards(self):
+        for mode in ("frequency", "dice"):
+            self.assertEqual(list(generate_grids(4, 10, seed=3, mode=mode)),
+                             list(generate_grids(4, 10, seed=3, mode=mode)))
+        self.assertNotEqual(list(generate_grids(4, 10, seed=3)), list(generate_grids(4, 10, seed=4)))
+    
+    def test_invalid_arguments(self):
+        rng = random.Random(0)
+        with self.assertRaises(ValueError):
+            random_grid(4, rng, mode="uniform")
+        with self.assertRaises(ValueError):
+            random_grid(7, rng, mode="dice")
+
+
+if __name__ == '__main__':
+    unittest.main()
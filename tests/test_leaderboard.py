@@ -0,0 +1,106 @@
+import random
+import sqlite3
+import unittest
+from backend.leaderboard import (BACKFILL, INSERT_COLUMNS, LENGTH_COLUMNS, SCHEMA,
+                                 leaderboard_page, length_scores_row)
+
+
+class SqliteCursor:
+    
+    def __init__(self, conn):
+        self.cursor = conn.cursor()
+    
+    def execute(self, query, params=()):
+        self.cursor.execute(query.replace('%s', '?'), params)
+    
+    def fetchall(self):
+        return self.cursor.fetchall()
+    
+    def fetchone(self):
+        return self.cursor.fetchone()
+
+
+def word_score(word):
+    length = len(word)
+    if length == 3:
+        return 100
+    if length < 6:
+        return (length - 3) * 400
+    return (length - 3) * 400 + 200
+
+
+class TestLeaderboard(unittest.TestCase):
+    
+    def setUp(self):
+        rng = random.Random(14)
+        self.db = sqlite3.connect(':memory:')
+        self.db.executescript(SCHEMA)
+        self.db.execute('CREATE TABLE board_words (board TEXT, word TEXT, value INTEGER)')
+        self.words = {}
+        for i in range(120):
+            board = f'board{i:03d}'
+            words = {'x' * rng.randrange(3, 10) + str(j) for j in range(rng.randrange(1, 8))}
+            self.words[board] = [(word, word_score(word)) for word in words]
+            self.db.executemany('INSERT INTO board_words VALUES (?, ?, ?)',
+                                [(board, word, score) for word, score in self.words[board]])
+        # Half the rows come from the writer's path, half from the backfill
+        placeholders = ', '.join('?' * (len(LENGTH_COLUMNS) + 2))
+        for board in list(self.words)[::2]:
+            self.db.execute(f'INSERT INTO board_length_scores ({INSERT_COLUMNS}) VALUES ({placeholders})',
+                            length_scores_row(board, self.words[board]))
+        self.db.execute(BACKFILL)
+        self.cur = SqliteCursor(self.db)
+    
+    def tearDown(self):
+        self.db.close()
+    
+    def expected(self, lengths):
+        totals = {board: sum(score for word, score in words if len(word) in lengths)
+                  for board, words in self.words.items()}
+        return sorted(((board, total) for board, total in totals.items() if total),
+                      key=lambda record: (-record[1], record[0]))
+    
+    def walk(self, lengths, page_size):
+        pages = [leaderboard_page(self.cur, lengths, page_size=page_size).records]
+        while pages[-1]:
+            board, score = pages[-1][-1]
+            pages.append(leaderboard_page(self.cur, lengths, after=(score, board), page_size=page_size).records)
+        return pages[:-1]
+    
+    def test_backfill_total_matches_length_scores_row(self):
+        results = [('x' * 17, word_score('x' * 17)), ('cat', 100), ('cats', 400)]
+        self.db.executemany('INSERT INTO board_words VALUES (?, ?, ?)', [('long', word, score) for word, score in results])
+        self.db.execute(BACKFILL)
+        row = self.db.execute(f'SELECT {INSERT_COLUMNS} FROM board_length_scores WHERE board = ?', ('long',)).fetchone()
+        self.assertEqual(row, length_scores_row('long', results))
+        self.assertEqual(row[-1], 500)
+    
+    def test_length_scores_row(self):
+        row = length_scores_row('b', [('cat', 100), ('cats', 400), ('dog', 100)])
+        self.assertEqual(row[0], 'b')
+        self.assertEqual(row[1:3], (200, 400))
+        self.assertEqual(row[-1], 600)
+    
+    def test_pages_match_group_by(self):
+        for lengths in [list(range(3, 17)), [3], [4, 7], [5, 6, 8, 9]]:
+            pages = self.walk(lengths, 7)
+            self.assertEqual([record for page in pages for record in page], self.expected(lengths))
+    
+    def test_before_cursor_returns_previous_page(self):
+        lengths = [3, 4, 5]
+        pages = self.walk(lengths, 5)
+        board, score = pages[2][0]
+        previous = leaderboard_page(self.cur, lengths, before=(score, board), page_size=5)
+        self.assertEqual(previous.records, pages[1])
+    
+    def test_total_is_capped(self):
+        page = leaderboard_page(self.cur, [3, 4, 5, 6, 7, 8, 9], page_size=5)
+        self.assertEqual(page.total_records, 50)
+        self.assertTrue(page.more_records)
+        page = leaderboard_page(self.cur, [9])
+        self.assertEqual(page.total_records, len(self.expected([9])))
+        self.assertFalse(page.more_records)
+
+
+if __name__ == '__main__':
+    unittest.main()
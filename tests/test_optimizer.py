@@ -0,0 +1,56 @@
+import os
+import tempfile
+import unittest
+from backend.optimizer import anneal, board_score, load_checkpoint, optimize, save_checkpoint
+from backend.solver import Solver
+from backend.trie import TrieMap
+
+WORDS = ["cat", "cats", "scat", "act", "acts", "tact", "taco", "coat", "coats", "oats", "stoa", "taos"]
+
+
+class TestOptimizer(unittest.TestCase):
+    
+    def setUp(self):
+        self.dictionary = TrieMap()
+        self.dictionary.load_from_list(WORDS)
+        self.solver = Solver(self.dictionary, engine="iterative", prefilter="off")
+        self.tmp = tempfile.TemporaryDirectory()
+    
+    def tearDown(self):
+        self.tmp.cleanup()
+    
+    def test_anneal_never_reports_worse_than_start(self):
+        start = "xxxxxxxxx"
+        result = anneal(self.solver, 3, 300, seed=1, start_grid=start)
+        self.assertGreaterEqual(result.score, board_score(self.solver, start))
+        self.assertGreater(result.score, 0)
+        self.assertEqual(result.score, board_score(self.solver, result.grid))
+        self.assertEqual(result.evaluations, 301)
+        self.assertLessEqual(result.solves, result.evaluations)
+    
+    def test_anneal_is_reproducible(self):
+        self.assertEqual(anneal(self.solver, 3, 100, seed=7), anneal(self.solver, 3, 100, seed=7))
+    
+    def test_checkpoint_keeps_best(self):
+        path = os.path.join(self.tmp.name, "best.json")
+        self.assertEqual(load_checkpoint(path), {})
+        save_checkpoint(path, {"a": 100, "b": 300, "c": 200}, keep=2)
+        self.assertEqual(load_checkpoint(path), {"b": 300, "c": 200})
+    
+    def test_optimize_across_pool(self):
+        dictionary_path = os.path.join(self.tmp.name, "words.txt")
+        with open(dictionary_path, "w") as f:
+            f.write("\n".join(WORDS))
+        checkpoint = os.path.join(self.tmp.name, "best.json")
+        best = optimize(size=3, runs=3, steps=50, seed=2, workers=2, checkpoint_path=checkpoint,
+                        dictionary_path=dictionary_path)
+        self.assertEqual(load_checkpoint(checkpoint), best)
+        self.assertTrue(all(len(grid) == 9 for grid in best))
+        
+        again = optimize(size=3, runs=1, steps=50, seed=3, workers=1, checkpoint_path=checkpoint,
+                         dictionary_path=dictionary_path)
+        self.assertGreaterEqual(max(again.values()), max(best.values()))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,55 @@
+import random
+import unittest
+from backend.board import Board
+from backend.parallel import ParallelSolver
+from backend.solver import Solver, get_dictionary
+
+
+class TestParallelSolver(unittest.TestCase):
+    
+    @classmethod
+    def setUpClass(cls):
+        cls.sequential = Solver(get_dictionary())
+        cls.parallel = ParallelSolver(workers=3)
+    
+    @classmethod
+    def tearDownClass(cls):
+        cls.parallel.close()
+    
+    def test_matches_sequential_solve(self):
+        rng = random.Random(11)
+        for size in (3, 4, 5, 7):
+            board = Board("".join(rng.choice("aeiourstlnmdcpbgh") for _ in range(size * size)))
+            self.assertEqual(self.parallel.solve(board), self.sequential.solve(board))
+    
+    def test_top_k_and_min_length(self):
+        board = Board("catdogefghijklmnopqrstuvw")
+        expected = self.sequential.solve(board, min_length=4)
+        self.assertEqual(self.parallel.solve(board, min_length=4), expected)
+        self.assertEqual(self.parallel.solve(board, top_k=3), self.sequential.solve(board, top_k=3))
+    
+    def test_more_workers_than_cells(self):
+        with ParallelSolver(workers=12) as solver:
+            board = Board("catdogrxb")
+            self.assertEqual(solver.solve(board), self.sequential.solve(board))
+    
+    def test_deadline(self):
+        board = Board("".join(random.Random(12).choice("aeiourstlnmdcpbgh") for _ in range(100)))
+        expected = self.sequential.solve(board)
+        self.assertEqual(self.parallel.solve(board, deadline_ms=60000), expected)
+        self.assertFalse(self.parallel.partial)
+        self.assertEqual(self.parallel.cells_covered, 100)
+        
+        results = self.parallel.solve(board, deadline_ms=0)
+        self.assertTrue(self.parallel.partial)
+        self.assertLess(self.parallel.cells_covered, 100)
+        self.assertTrue(set(results) <= set(expected))
+    
+    def test_found_words_merged(self):
+        board = Board("catdogefghijklmn")
+        results = self.parallel.solve(board)
+        self.assertEqual(self.parallel.found_words, {word for word, _ in results})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,67 @@
+import gzip
+import json
+import os
+import tempfile
+import unittest
+from backend.board import Board
+from backend.generator import generate_grids
+from backend.pipeline import chunk_seed, run_pipeline, solve_boards, write_ndjson
+from backend.solver import Solver
+from backend.storage import SqliteStorage
+from backend.trie import TrieMap
+
+WORDS = ["tea", "eat", "ate", "set", "sea", "seat", "east", "rate", "tear", "near", "earn", "note", "tone"]
+
+
+class TestPipeline(unittest.TestCase):
+    
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.dictionary_path = os.path.join(self.tmp.name, "words.txt")
+        with open(self.dictionary_path, "w") as f:
+            f.write("\n".join(WORDS))
+    
+    def tearDown(self):
+        self.tmp.cleanup()
+    
+    def solve(self, workers: int, chunk_boards: int = 4) -> list:
+        return [submission for batch in solve_boards(4, 10, seed=5, workers=workers, chunk_boards=chunk_boards,
+                                                     dictionary_path=self.dictionary_path)
+                for submission in batch]
+    
+    def test_boards_are_solved_in_order(self):
+        submissions = self.solve(workers=2)
+        dictionary = TrieMap()
+        dictionary.load_from_list(WORDS)
+        solver = Solver(dictionary)
+        grids = [grid for chunk, count in enumerate((4, 4, 2))
+                 for grid in generate_grids(4, count, chunk_seed(5, chunk))]
+        self.assertEqual([s.board for s in submissions], grids)
+        for submission in submissions:
+            self.assertEqual(submission.results, solver.solve(Board(submission.board)))
+            self.assertEqual(submission.total_score, solver.get_total_score(submission.results))
+    
+    def test_output_does_not_depend_on_workers(self):
+        self.assertEqual(self.solve(workers=1), self.solve(workers=3))
+    
+    def test_gzipped_ndjson(self):
+        path = os.path.join(self.tmp.name, "boards.ndjson.gz")
+        submissions = self.solve(workers=1)
+        with gzip.open(path, "wt") as out:
+            boards, words = run_pipeline(iter([submissions]), lambda batch: write_ndjson(out, batch), 10)
+        self.assertEqual((boards, words), (10, sum(len(s.results) for s in submissions)))
+        with gzip.open(path, "rt") as f:
+            lines = [json.loads(line) for line in f]
+        self.assertEqual([line["grid"] for line in lines], [s.board for s in submissions])
+        self.assertEqual(lines[0]["words"], [list(word) for word in submissions[0].results])
+    
+    def test_load_into_storage(self):
+        storage = SqliteStorage(os.path.join(self.tmp.name, "boards.db"))
+        batches = solve_boards(4, 10, seed=5, workers=2, chunk_boards=4, dictionary_path=self.dictionary_path)
+        run_pipeline(batches, storage.record_submissions, 10)
+        self.assertEqual(len(storage.board_values()), len({s.board for s in self.solve(workers=1)}))
+        storage.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,74 @@
+import random
+import unittest
+from backend.board import Board
+from backend.generator import generate_grids
+from backend.prefilter import build_board_trie
+from backend.solver import Solver, get_dictionary
+from backend.trie import TrieMap
+
+
+class TestBuildBoardTrie(unittest.TestCase):
+    
+    def setUp(self):
+        self.dictionary = TrieMap()
+        self.dictionary.load_from_list(["cat", "act", "tact", "coat", "taco", "dog", "catcat"])
+    
+    def test_keeps_only_feasible_words(self):
+        board = Board("cotxaxxxx")
+        trie = build_board_trie(self.dictionary, board)
+        
+        self.assertTrue(trie.search("cat"))
+        self.assertTrue(trie.search("coat"))
+        self.assertTrue(trie.search("taco"))
+        self.assertFalse(trie.search("tact"))
+        self.assertFalse(trie.search("dog"))
+        self.assertFalse(trie.search("catcat"))
+    
+    def test_requires_adjacent_letter_pairs(self):
+        board = Board("actxxxxxx")
+        trie = build_board_trie(self.dictionary, board)
+        
+        self.assertFalse(trie.search("cat"))
+        self.assertTrue(trie.search("act"))
+    
+    def test_empty_board_match(self):
+        trie = build_board_trie(self.dictionary, Board("zzzzzzzzz"))
+        self.assertEqual(trie.size, 0)
+
+
+class TestSolverPrefilter(unittest.TestCase):
+    
+    def test_unknown_mode(self):
+        with self.assertRaises(ValueError):
+            Solver(TrieMap(), prefilter="sometimes")
+    
+    def test_auto_switch(self):
+        solver = Solver(TrieMap())
+        self.assertTrue(solver._use_prefilter(Board("esesesesesesesee")))
+        self.assertFalse(solver._use_prefilter(Board("abcdefghijklmnop")))
+        self.assertTrue(Solver(TrieMap(), prefilter="on")._use_prefilter(Board("abcdefghijklmnop")))
+        self.assertFalse(Solver(TrieMap(), prefilter="off")._use_prefilter(Board("esesesesesesesee")))
+    
+    def test_auto_keeps_large_random_boards_on_full_trie(self):
+        solver = Solver(TrieMap())
+        for size in (8, 13, 20):
+            for grid in generate_grids(size, 3, seed=size):
+                self.assertFalse(solver._use_prefilter(Board(grid)))
+        self.assertFalse(solver._use_prefilter(Board("aeilnorst" * 36)))
+        self.assertTrue(solver._use_prefilter(Board("aest" * 100)))
+    
+    def test_modes_return_identical_results(self):
+        dictionary = get_dictionary()
+        full = Solver(dictionary, prefilter="off")
+        filtered = Solver(dictionary, prefilter="on")
+        rng = random.Random(3)
+        for alphabet in ("est", "aestr", "aeilnorstdcm"):
+            for size in (4, 5):
+                board = Board("".join(rng.choice(alphabet) for _ in range(size * size)))
+                expected = full.solve(board)
+                self.assertEqual(filtered.solve(board), expected)
+                self.assertEqual(filtered.found_words, full.found_words)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,68 @@
+import random
+import sqlite3
+import unittest
+from backend.ranking import ScoreIndex
+
+
+class TestScoreIndex(unittest.TestCase):
+
+    def setUp(self):
+        rng = random.Random(13)
+        self.rows = [(f"board{i}", rng.choice([0, 100, 400, 800, 1000]) + 100 * rng.randrange(300))
+                     for i in range(2000)]
+        self.db = sqlite3.connect(":memory:")
+        self.db.execute("CREATE TABLE board_values (board TEXT PRIMARY KEY, value INTEGER)")
+        self.db.executemany("INSERT INTO board_values VALUES (?, ?)", self.rows)
+
+    def tearDown(self):
+        self.db.close()
+
+    def sql_counts(self, value):
+        return self.db.execute('''
+        SELECT COUNT(*), SUM(CASE WHEN value >= ? AND value != 0 THEN 1 ELSE 0 END)
+        FROM board_values
+        ''', (value,)).fetchone()
+
+    def test_matches_sql_counts(self):
+        index = ScoreIndex(self.rows)
+        for value in [0, 100, 1500, 9900, 10000, 25000, 31000, 10 ** 6]:
+            total, better = self.sql_counts(value)
+            self.assertEqual(index.total, total)
+            self.assertEqual(index.count_at_least(value), better, value)
+            expected = round(((total - better) / max(total - 1, 1)) * 100, 2)
+            self.assertEqual(index.percentile(value), expected)
+
+    def test_duplicate_boards_count_once(self):
+        index = ScoreIndex(self.rows)
+        self.assertFalse(index.add("board0", 5000))
+        self.assertTrue(index.add("new", 5000))
+        self.assertEqual(index.total, len(self.rows) + 1)
+        self.assertIn("new", index)
+
+    def test_percentile_of_unknown_board_leaves_index_unchanged(self):
+        index = ScoreIndex(self.rows)
+        added = ScoreIndex(self.rows)
+        added.add("new", 5000)
+        self.assertEqual(index.percentile(5000, "new"), added.percentile(5000))
+        self.assertEqual(index.percentile(5000, "board0"), index.percentile(5000))
+        self.assertEqual(index.total, len(self.rows))
+        self.assertNotIn("new", index)
+
+    def test_grows_past_capacity(self):
+        index = ScoreIndex(capacity=4)
+        for i, value in enumerate([100, 2000, 50000, 300]):
+            index.add(str(i), value)
+        self.assertEqual(index.count_at_least(300), 3)
+        self.assertEqual(index.count_at_least(50000), 1)
+        self.assertEqual(index.count_at_least(50100), 0)
+
+    def test_load_replaces_contents(self):
+        index = ScoreIndex([("x", 100)])
+        index.load(self.rows)
+        self.assertTrue(index.loaded)
+        self.assertNotIn("x", index)
+        self.assertEqual(index.total, len(self.rows))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,69 @@
+import random
+import unittest
+from backend.board import Board
+from backend.session import SolverSession
+from backend.solver import Solver, get_dictionary
+from backend.trie import TrieMap, letters_mask
+
+
+class TestSolverSession(unittest.TestCase):
+    
+    @classmethod
+    def setUpClass(cls):
+        cls.dictionary = get_dictionary()
+    
+    def test_matches_full_solve_after_edits(self):
+        rng = random.Random(22)
+        letters = "aeiourstlnmdcpbgh"
+        for size in (4, 5):
+            board = Board("".join(rng.choice(letters) for _ in range(size * size)))
+            session = SolverSession(self.dictionary, board)
+            solver = Solver(self.dictionary)
+            self.assertEqual(session.results(), solver.solve(Board("".join(board.letters))))
+            
+            for _ in range(25):
+                before = session.words
+                row, col = rng.randrange(size), rng.randrange(size)
+                delta = session.set_cell(row, col, rng.choice(letters))
+                
+                expected = solver.solve(Board("".join(board.letters)))
+                self.assertEqual(session.results(), expected)
+                self.assertEqual(session.total_score(), sum(score for _, score in expected))
+                self.assertEqual({word for word, _ in delta.added}, session.words - before)
+                self.assertEqual({word for word, _ in delta.removed}, before - session.words)
+                self.assertEqual(board.letter_mask, letters_mask(board.letters))
+    
+    def test_delta_for_single_edit(self):
+        dictionary = TrieMap()
+        dictionary.load_from_list(["cat", "cot", "act", "tab"])
+        board = Board("catxxxxxx")
+        session = SolverSession(dictionary, board)
+        self.assertEqual(session.words, {"cat"})
+        
+        delta = session.set_cell(0, 1, "o")
+        self.assertEqual(delta.added, [("cot", 100)])
+        self.assertEqual(delta.removed, [("cat", 100)])
+        self.assertEqual(board.letters[:3], ["c", "o", "t"])
+        self.assertEqual(board.get_letter(0, 1), "o")
+        
+        self.assertEqual(session.set_cell(0, 1, "O"), ([], []))
+    
+    def test_incremental_search_visits_fewer_nodes(self):
+        board = Board(("aeiourstlnmdcpbgh" * 3)[:36])
+        session = SolverSession(self.dictionary, board)
+        full_visits = session.nodes_visited
+        session.set_cell(0, 0, "z")
+        self.assertLess(session.nodes_visited, full_visits)
+    
+    def test_invalid_edits(self):
+        session = SolverSession(self.dictionary, Board("catsdogsbirdfish"))
+        with self.assertRaises(ValueError):
+            session.set_cell(4, 0, "a")
+        with self.assertRaises(ValueError):
+            session.set_cell(0, 0, "ab")
+        with self.assertRaises(ValueError):
+            session.set_cell(0, 0, "1")
+
+
+if __name__ == '__main__':
+    unittest.main()
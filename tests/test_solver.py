@@ -1,7 +1,14 @@
+import random
+import time
 import unittest
+from unittest.mock import patch
 from backend.trie import TrieMap
 from backend.board import Board
-from backend.solver import Solver, load_dictionary
+from backend import solver as solver_module
+from backend.solver import (
+    Solver, load_dictionary, get_dictionary, dictionary_stats, clear_dictionaries, web_solver,
+    web_deadline_ms, WEB_DEADLINE_MS
+)
 
 
 class TestSolver(unittest.TestCase):
@@ -191,6 +198,225 @@ class TestSolver(unittest.TestCase):
             self.assertTrue(len(word) >= 3)
 
 
+class TestSolverEngines(unittest.TestCase):
+    
+    def test_unknown_engine(self):
+        with self.assertRaises(ValueError):
+            Solver(TrieMap(), engine="quantum")
+    
+    def test_engines_match_on_random_boards(self):
+        dictionary = get_dictionary()
+        rng = random.Random(5)
+        recursive = Solver(dictionary, engine="recursive")
+        iterative = Solver(dictionary, engine="iterative")
+        for size in (3, 4, 5, 6, 8):
+            for _ in range(3):
+                board = Board("".join(rng.choice("aeiourstlnmdcpbgh") for _ in range(size * size)))
+                self.assertEqual(iterative.solve(board), recursive.solve(board))
+    
+    def test_iterative_finds_long_snake_word(self):
+        rows = ["".join(chr(97 + (row * 10 + col) % 26) for col in range(10)) for row in range(10)]
+        word = "".join(row if i % 2 == 0 else row[::-1] for i, row in enumerate(rows))
+        snake = "".join(rows)
+        
+        dictionary = TrieMap()
+        dictionary.insert(word)
+        results = Solver(dictionary, engine="iterative").solve(Board(snake))
+        
+        self.assertEqual([found for found, _ in results], [word])
+
+
+class TestSolverPruning(unittest.TestCase):
+    
+    def test_missing_letter_prunes_branch(self):
+        dictionary = TrieMap()
+        dictionary.load_from_list(["cat", "catnip", "catnap", "cattle"])
+        board = Board("catnxxxxx")
+        
+        for engine in ("recursive", "iterative"):
+            solver = Solver(dictionary, engine=engine, prefilter="off")
+            results = solver.solve(board)
+            self.assertEqual(results, [("cat", 100)])
+            self.assertEqual(solver.nodes_visited, 3)
+    
+    def test_pruning_keeps_results(self):
+        dictionary = get_dictionary()
+        
+        class Unpruned:
+            root = dictionary.root
+            child = staticmethod(dictionary.child)
+            is_terminal = staticmethod(dictionary.is_terminal)
+            
+            @staticmethod
+            def can_extend(node, missing_letters, free_cells):
+                return True
+        
+        rng = random.Random(9)
+        for size in (3, 4, 5):
+            board = Board("".join(rng.choice("abcdeilmnorstu") for _ in range(size * size)))
+            pruned = Solver(dictionary, prefilter="off")
+            unpruned = Solver(Unpruned(), prefilter="off")
+            self.assertEqual(pruned.solve(board), unpruned.solve(board))
+            self.assertLessEqual(pruned.nodes_visited, unpruned.nodes_visited)
+
+
+class TestSolverTopK(unittest.TestCase):
+    
+    @classmethod
+    def setUpClass(cls):
+        cls.dictionary = get_dictionary()
+        rng = random.Random(21)
+        cls.boards = [Board("".join(rng.choice("aeiourstlnmdcpbgh") for _ in range(size * size)))
+                      for size in (4, 4, 5, 6)]
+    
+    def test_invalid_top_k(self):
+        with self.assertRaises(ValueError):
+            Solver(self.dictionary).solve(self.boards[0], top_k=0)
+    
+    def test_top_k_matches_full_solve(self):
+        for engine in ("recursive", "iterative"):
+            solver = Solver(self.dictionary, engine=engine, prefilter="off")
+            for board in self.boards:
+                expected = solver.solve(board)
+                full_visits = solver.nodes_visited
+                for k in (1, 5, 20, 10000):
+                    self.assertEqual(solver.solve(board, top_k=k), expected[:k])
+                    self.assertLessEqual(solver.nodes_visited, full_visits)
+    
+    def test_min_length(self):
+        solver = Solver(self.dictionary, prefilter="off")
+        for board in self.boards:
+            expected = solver.solve(board)
+            full_visits = solver.nodes_visited
+            for min_length in (3, 5, 7):
+                results = solver.solve(board, min_length=min_length)
+                self.assertEqual(results, [(w, s) for w, s in expected if len(w) >= min_length])
+                self.assertLessEqual(solver.nodes_visited, full_visits)
+            self.assertEqual(solver.solve(board, top_k=3, min_length=6),
+                             [(w, s) for w, s in expected if len(w) >= 6][:3])
+    
+    def test_top_k_with_prefilter(self):
+        board = Board("esesesesesesesee")
+        expected = Solver(self.dictionary, prefilter="off").solve(board)
+        self.assertEqual(Solver(self.dictionary, prefilter="on").solve(board, top_k=2), expected[:2])
+
+
+class TestSolverStreaming(unittest.TestCase):
+    
+    @classmethod
+    def setUpClass(cls):
+        cls.dictionary = get_dictionary()
+        rng = random.Random(20)
+        cls.boards = [Board("".join(rng.choice("aeiourstlnmdcpbgh") for _ in range(size * size)))
+                      for size in (4, 5, 6)] + [Board("esesesesesesesee")]
+    
+    def test_iter_words_matches_solve(self):
+        for engine in ("recursive", "iterative"):
+            for prefilter in ("off", "on"):
+                solver = Solver(self.dictionary, engine=engine, prefilter=prefilter)
+                for board in self.boards:
+                    expected = solver.solve(board)
+                    streamed = list(solver.iter_words(board))
+                    self.assertEqual(len(streamed), len(set(streamed)))
+                    self.assertEqual(sorted(streamed, key=lambda x: (-x[1], x[0])), expected)
+                    self.assertEqual(solver.found_words, {word for word, _ in expected})
+    
+    def test_iter_words_is_lazy(self):
+        solver = Solver(self.dictionary, prefilter="off")
+        words = solver.iter_words(self.boards[2], min_length=4)
+        first = next(words)
+        self.assertGreaterEqual(len(first[0]), 4)
+        self.assertLess(len(solver.found_words), len(solver.solve(self.boards[2], min_length=4)))
+
+
+class TestSolverDeadline(unittest.TestCase):
+    
+    @classmethod
+    def setUpClass(cls):
+        cls.dictionary = get_dictionary()
+        rng = random.Random(22)
+        cls.board = Board("".join(rng.choice("aeiourstlnmdcpbgh") for _ in range(100)))
+    
+    def test_expired_deadline_returns_partial_results(self):
+        for engine in ("recursive", "iterative"):
+            solver = Solver(self.dictionary, engine=engine, prefilter="off")
+            expected = solver.solve(self.board)
+            self.assertFalse(solver.partial)
+            self.assertEqual(solver.cells_covered, 100)
+            
+            results = solver.solve(self.board, deadline_ms=0)
+            self.assertTrue(solver.partial)
+            self.assertLess(solver.cells_covered, 100)
+            self.assertLess(len(results), len(expected))
+            self.assertTrue(set(results) <= set(expected))
+    
+    def test_generous_deadline_is_complete(self):
+        solver = Solver(self.dictionary, prefilter="off")
+        expected = solver.solve(self.board)
+        self.assertEqual(solver.solve(self.board, deadline_ms=60000), expected)
+        self.assertFalse(solver.partial)
+    
+    def test_iter_words_deadline(self):
+        solver = Solver(self.dictionary, prefilter="off")
+        expected = solver.solve(self.board)
+        streamed = list(solver.iter_words(self.board, deadline_ms=0))
+        self.assertTrue(solver.partial)
+        self.assertLess(len(streamed), len(expected))
+        self.assertEqual(len(list(solver.iter_words(self.board, deadline_ms=60000))), len(expected))
+        self.assertFalse(solver.partial)
+        self.assertEqual(solver.cells_covered, 100)
+    
+    def test_prefilter_build_respects_deadline(self):
+        solver = Solver(self.dictionary, prefilter="on")
+        started = time.monotonic()
+        solver.solve(Board("".join(self.board.letters) * 4), deadline_ms=50)
+        self.assertLess(time.monotonic() - started, 1.0)
+        self.assertTrue(solver.partial)
+    
+    def test_web_deadline_is_clamped(self):
+        self.assertEqual(web_deadline_ms(None), WEB_DEADLINE_MS)
+        self.assertEqual(web_deadline_ms(float("nan")), WEB_DEADLINE_MS)
+        self.assertEqual(web_deadline_ms(float("inf")), WEB_DEADLINE_MS)
+        self.assertEqual(web_deadline_ms(-5), 0)
+        self.assertEqual(web_deadline_ms(WEB_DEADLINE_MS * 10), WEB_DEADLINE_MS)
+        self.assertEqual(web_deadline_ms(50), 50)
+    
+    def test_deadline_with_prefilter_and_top_k(self):
+        solver = Solver(self.dictionary, prefilter="on")
+        results = solver.solve(self.board, top_k=5, deadline_ms=0)
+        self.assertTrue(solver.partial)
+        self.assertLessEqual(len(results), 5)
+
+
+class TestSolverScore(unittest.TestCase):
+    
+    @classmethod
+    def setUpClass(cls):
+        cls.dictionary = get_dictionary()
+        rng = random.Random(24)
+        cls.boards = [Board("".join(rng.choice("aeiourstlnmdcpbgh") for _ in range(size * size)))
+                      for size in (3, 4, 5, 6)] + [Board("esesesesesesesee")]
+    
+    def test_score_matches_solve(self):
+        for prefilter in ("off", "on"):
+            solver = Solver(self.dictionary, prefilter=prefilter)
+            for board in self.boards:
+                for min_length in (3, 5):
+                    results = solver.solve(board, min_length=min_length)
+                    lengths = {}
+                    for word, _ in results:
+                        lengths[len(word)] = lengths.get(len(word), 0) + 1
+                    scored = solver.score(board, min_length=min_length)
+                    self.assertEqual(scored.total_score, solver.get_total_score(results))
+                    self.assertEqual(scored.word_count, len(results))
+                    self.assertEqual(scored.length_counts, lengths)
+    
+    def test_score_counts_each_word_once(self):
+        dictionary = TrieMap()
+        dictionary.load_from_list(["aaa", "aaaa"])
+        self.assertEqual(Solver(dictionary).score(Board("aaaaaaaaa")), (500, 2, {3: 1, 4: 1}))
+
+
 class TestSolverIntegration(unittest.TestCase):
     
     def test_full_workflow(self):
@@ -281,5 +507,46 @@ class TestLoadDictionary(unittest.TestCase):
         self.assertGreater(dictionary.size, 0)
 
 
+
+class TestDictionaryRegistry(unittest.TestCase):
+    
+    def setUp(self):
+        clear_dictionaries()
+    
+    def tearDown(self):
+        clear_dictionaries()
+    
+    def test_get_dictionary_returns_same_instance(self):
+        first = get_dictionary()
+        second = get_dictionary()
+        self.assertIs(first, second)
+    
+    def test_dictionary_stats(self):
+        self.assertIsNone(dictionary_stats())
+        dictionary = get_dictionary()
+        stats = dictionary_stats()
+        
+        self.assertEqual(stats["words"], dictionary.size)
+        self.assertEqual(stats["nodes"], dictionary.node_count)
+        self.assertGreaterEqual(stats["load_seconds"], 0)
+    
+    def test_web_solver_reuses_dictionary(self):
+        seen = []
+        original_init = Solver.__init__
+        
+        def recording_init(solver, dictionary, *args, **kwargs):
+            seen.append(dictionary)
+            original_init(solver, dictionary, *args, **kwargs)
+        
+        with patch.object(solver_module, "load_dictionary", wraps=load_dictionary) as loader, \
+                patch.object(Solver, "__init__", recording_init):
+            web_solver("catdogefghijklmn")
+            web_solver("abcdefghijklmnop")
+        
+        self.assertEqual(loader.call_count, 1)
+        self.assertEqual(len(seen), 2)
+        self.assertIs(seen[0], seen[1])
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,104 @@
+import os
+import tempfile
+import threading
+import unittest
+from backend.storage import SqliteStorage, Storage, open_storage
+from backend.writer import Submission
+
+
+class TestSqliteStorage(unittest.TestCase):
+    
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.storage = SqliteStorage(os.path.join(self.tmp.name, 'test.db'))
+    
+    def tearDown(self):
+        self.storage.close()
+        self.tmp.cleanup()
+    
+    def test_uses_wal(self):
+        with self.storage._connection() as conn:
+            mode = conn.execute('PRAGMA journal_mode;').fetchone()[0]
+        self.assertEqual(mode, 'wal')
+    
+    def test_record_submissions_ignores_duplicates(self):
+        self.storage.record_submissions([
+            Submission('board1', 500, [('cat', 100), ('cats', 400)]),
+            Submission('board1', 500, [('cat', 100), ('cats', 400)]),
+            Submission('board2', 100, [('dog', 100)]),
+        ])
+        self.storage.record_submissions([Submission('board2', 100, [('dog', 100)])])
+        self.assertEqual(sorted(self.storage.board_values()), [('board1', 500), ('board2', 100)])
+        with self.storage._connection() as conn:
+            words = conn.execute('SELECT COUNT(*) FROM board_words').fetchone()[0]
+        self.assertEqual(words, 3)
+    
+    def test_leaderboard_page(self):
+        self.storage.record_submissions([
+            Submission('board1', 500, [('cat', 100), ('cats', 400)]),
+            Submission('board2', 200, [('dog', 100), ('pig', 100)]),
+        ])
+        self.assertEqual(self.storage.leaderboard_page([3, 4]).records, [('board1', 500), ('board2', 200)])
+        self.assertEqual(self.storage.leaderboard_page([3]).records, [('board2', 200), ('board1', 100)])
+        page = self.storage.leaderboard_page([3], after=(200, 'board2'))
+        self.assertEqual(page.records, [('board1', 100)])
+        self.assertEqual(page.total_records, 2)
+    
+    def test_percentile_seeds_from_stored_boards(self):
+        self.storage.record_submissions([Submission(f'b{i}', 100 * (i + 1), []) for i in range(5)])
+        self.assertEqual(self.storage.percentile('new', 400), 60.0)
+        self.assertEqual(self.storage.percentile('b4', 500), 100.0)
+        self.assertEqual(self.storage.score_index.total, 5)
+        self.assertFalse(self.storage.is_known('new'))
+    
+    def test_write_batch_marks_boards_known_once_stored(self):
+        self.assertFalse(self.storage.is_known('board1'))
+        self.storage.write_batch([Submission('board1', 600, [('dog', 100), ('cats', 400), ('cat', 100)])])
+        self.assertTrue(self.storage.is_known('board1'))
+        self.assertEqual(self.storage.score_index.total, 1)
+        self.assertIsNotNone(self.storage.stored_results('board1'))
+    
+    def test_stored_results_for_known_boards(self):
+        self.storage.record_submissions([Submission('board1', 600, [('dog', 100), ('cats', 400), ('cat', 100)])])
+        self.assertFalse(self.storage.score_index.loaded)
+        self.assertTrue(self.storage.is_known('board1'))
+        self.assertTrue(self.storage.score_index.loaded)
+        self.assertFalse(self.storage.is_known('board2'))
+        self.assertEqual(self.storage.stored_results('board1'),
+                         ([('cats', 400), ('cat', 100), ('dog', 100)], 600))
+        self.assertIsNone(self.storage.stored_results('board2'))
+    
+    def test_connections_are_pooled_across_threads(self):
+        self.storage.record_submissions([Submission('board1', 100, [('cat', 100)])])
+        threads = [threading.Thread(target=self.storage.board_values) for _ in range(200)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertLessEqual(self.storage.opened, 4)
+        self.assertLessEqual(len(self.storage._idle), 4)
+
+
+class TestOpenStorage(unittest.TestCase):
+    
+    def test_sqlite_spec(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            storage = open_storage(f'sqlite:{os.path.join(tmp, "x.db")}')
+            self.assertIsInstance(storage, SqliteStorage)
+            storage.close()
+    
+    def test_unknown_spec(self):
+        with self.assertRaises(ValueError):
+            open_storage('mysql://nope')
+    
+    def test_backends_must_implement_the_queries(self):
+        class Partial(Storage):
+            def record_submissions(self, batch):
+                pass
+        
+        with self.assertRaises(TypeError):
+            Partial()
+
+
+if __name__ == '__main__':
+    unittest.main()
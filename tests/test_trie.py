@@ -1,6 +1,6 @@
 import unittest
 import tempfile
-from backend.trie import TrieNode, TrieMap
+from backend.trie import TrieNode, TrieMap, ALL_LETTERS, letters_mask
 
 
 class TestTrieNode(unittest.TestCase):
@@ -46,6 +46,13 @@ class TestTrieMap(unittest.TestCase):
         for word in words:
             self.assertTrue(self.trie.search(word))
     
+    def test_node_count(self):
+        self.trie.insert("cat")
+        self.trie.insert("car")
+        self.trie.insert("cat")
+        
+        self.assertEqual(self.trie.node_count, 5)
+    
     def test_insert_duplicate_word(self):
         self.trie.insert("cat")
         self.assertEqual(self.trie.size, 1)
@@ -141,6 +148,45 @@ class TestTrieMap(unittest.TestCase):
         self.assertIsNotNone(node)
         self.assertFalse(node.is_word)
     
+    def test_cursor_child_and_terminal(self):
+        self.trie.insert("cat")
+        self.trie.insert("catalog")
+        
+        node = self.trie.root
+        for char in "cat":
+            node = self.trie.child(node, char)
+            self.assertIsNotNone(node)
+        self.assertTrue(self.trie.is_terminal(node))
+        self.assertIs(node, self.trie._find_node("cat"))
+        
+        node = self.trie.child(node, "a")
+        self.assertFalse(self.trie.is_terminal(node))
+        self.assertIsNone(self.trie.child(node, "z"))
+    
+    def test_subtree_annotations(self):
+        self.trie.load_from_list(["cat", "cart", "cast", "cattle"])
+        node = self.trie._find_node("ca")
+        
+        self.assertEqual(node.letter_mask, letters_mask("t"))
+        self.assertEqual(node.min_depth, 1)
+        self.assertEqual(node.max_depth, 4)
+        self.assertEqual(self.trie.root.max_depth, 6)
+        
+        leaf = self.trie._find_node("cattle")
+        self.assertEqual(leaf.letter_mask, ALL_LETTERS)
+        self.assertGreater(leaf.min_depth, 16)
+    
+    def test_can_extend(self):
+        self.trie.load_from_list(["cat", "cattle", "catnip"])
+        node = self.trie._find_node("cat")
+        
+        self.assertTrue(self.trie.can_extend(node, 0, 3))
+        self.assertFalse(self.trie.can_extend(node, 0, 2))
+        self.assertTrue(self.trie.can_extend(node, letters_mask("l"), 3))
+        
+        node = self.trie._find_node("catt")
+        self.assertFalse(self.trie.can_extend(node, letters_mask("l"), 10))
+    
     def test_find_node_nonexistent(self):
         self.trie.insert("cat")
         
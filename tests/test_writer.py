@@ -0,0 +1,126 @@
+import threading
+import time
+import unittest
+from backend.writer import BoardWriter, WriterBusy
+
+
+class TestBoardWriter(unittest.TestCase):
+    
+    def setUp(self):
+        self.batches = []
+        self.writer = BoardWriter(self.batches.append, max_queue=100, batch_size=5,
+                                  flush_interval=0.05, put_timeout=0.05)
+    
+    def tearDown(self):
+        self.writer.close()
+    
+    def submit(self, count, prefix="b"):
+        for i in range(count):
+            self.writer.submit(f"{prefix}{i}", 100, [("cat", 100)])
+    
+    def test_no_thread_until_first_submit(self):
+        self.assertIsNone(self.writer._thread)
+        self.submit(1)
+        self.assertIsNotNone(self.writer._thread)
+    
+    def test_batches_by_size(self):
+        gate = threading.Event()
+        self.writer._write_batch = lambda batch: (gate.wait(1), self.batches.append(batch))
+        self.submit(1, "first")
+        time.sleep(0.1)
+        self.submit(12)
+        gate.set()
+        self.writer.flush()
+        
+        sizes = [len(batch) for batch in self.batches]
+        self.assertEqual(sum(sizes), 13)
+        self.assertLessEqual(max(sizes), 5)
+        self.assertEqual(self.writer.written, 13)
+    
+    def test_flushes_on_interval(self):
+        self.submit(2)
+        deadline = time.monotonic() + 2
+        while not self.batches and time.monotonic() < deadline:
+            time.sleep(0.01)
+        self.assertEqual([s.board for s in self.batches[0]], ["b0", "b1"])
+    
+    def test_backpressure_when_full(self):
+        gate = threading.Event()
+        writer = BoardWriter(lambda batch: gate.wait(2), max_queue=2, batch_size=1,
+                             flush_interval=0.01, put_timeout=0.05)
+        try:
+            with self.assertRaises(WriterBusy):
+                for i in range(10):
+                    writer.submit(f"b{i}", 100, [])
+        finally:
+            gate.set()
+            writer.close()
+    
+    def test_close_drains_queue(self):
+        self.submit(20)
+        self.writer.close()
+        self.assertEqual(sum(len(batch) for batch in self.batches), 20)
+        with self.assertRaises(WriterBusy):
+            self.submit(1)
+    
+    def test_submissions_racing_close_never_hang_flush(self):
+        writer = BoardWriter(lambda batch: time.sleep(0.001), max_queue=10, batch_size=2,
+                             flush_interval=0.01, put_timeout=0.05)
+        accepted = []
+        
+        def submit_until_closed(prefix):
+            for i in range(1000):
+                try:
+                    writer.submit(f"{prefix}{i}", 100, [])
+                except WriterBusy:
+                    continue
+                accepted.append(i)
+        
+        threads = [threading.Thread(target=submit_until_closed, args=(f"t{n}-",)) for n in range(4)]
+        for thread in threads:
+            thread.start()
+        time.sleep(0.05)
+        writer.close()
+        for thread in threads:
+            thread.join()
+        done = threading.Thread(target=writer.flush, daemon=True)
+        done.start()
+        done.join(2)
+        self.assertFalse(done.is_alive())
+        self.assertEqual(writer.pending(), 0)
+        self.assertEqual(writer.written, len(accepted))
+    
+    def test_close_gives_up_on_a_stuck_queue(self):
+        gate = threading.Event()
+        writer = BoardWriter(lambda batch: gate.wait(5), max_queue=1, batch_size=1,
+                             flush_interval=0.01, put_timeout=0.05)
+        writer.submit("b0", 100, [])
+        time.sleep(0.05)
+        writer.submit("b1", 100, [])
+        started = time.monotonic()
+        writer.close(timeout=0.1)
+        self.assertLess(time.monotonic() - started, 1)
+        gate.set()
+    
+    def test_failed_batch_is_retried_then_dropped(self):
+        attempts = []
+        
+        def flaky(batch):
+            attempts.append(batch)
+            if len(attempts) < 2:
+                raise RuntimeError("connection reset")
+        
+        self.writer._write_batch = flaky
+        self.submit(1)
+        self.writer.flush()
+        self.assertEqual(len(attempts), 2)
+        self.assertEqual(self.writer.written, 1)
+        
+        self.writer._write_batch = lambda batch: 1 / 0
+        self.submit(1)
+        self.writer.flush()
+        self.assertEqual(self.writer.failed, 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,11 +1,20 @@
-import random
-from flask import Flask, request
+from flask import Flask, Response, jsonify, request, stream_with_context, url_for
 from flask import render_template
 from backend.solver import *
-import psycopg2
-from psycopg2.extras import execute_values
+from backend.writer import BoardWriter, WriterBusy
+from backend.leaderboard import MAX_PAGES, PAGE_SIZE
+from backend.storage import open_storage
+import atexit
+import bisect
+import json
+import time
+from collections.abc import Mapping
 
 VALID_WORD_LENGTHS = list(range(3, 17))
+API_PAGE_SIZE = 200
+API_MAX_PAGE_SIZE = 1000
+SSE_CHUNK_WORDS = 50
+SSE_CHUNK_SECONDS = 0.05
 
 
 def score_for_length(word_length: int) -> int:
@@ -15,76 +24,25 @@ def score_for_length(word_length: int) -> int:
         return (word_length - 3) * 400
     return (word_length - 3) * 400 + 200
 
-host_string = "wordhunt-db.ch8ues0g2yx6.us-east-2.rds.amazonaws.com"
 app = Flask(__name__)
+# Postgres by default; WORDHUNT_STORAGE=sqlite:<path> runs fully locally
+storage = open_storage()
+atexit.register(storage.close)
+# Solved boards are persisted in batches by a background thread
+board_writer = BoardWriter(lambda batch: storage.write_batch(batch))
+atexit.register(board_writer.close)
+
+# Build the shared trie once at startup so requests never pay for it
+get_dictionary()
+_stats = dictionary_stats()
+print(f"Loaded dictionary {_stats['path']}: {_stats['words']} words, "
+      f"{_stats['nodes']} nodes in {_stats['load_seconds']:.2f}s")
 
 
 @app.route('/records', methods = ['GET'])
 def records():
     try:
-        conn = psycopg2.connect(
-            host=host_string,
-            database="postgres",
-            user="wwang038",
-            password="Password0988",
-            port=5432
-        )
-        page_size = 20
-
-        page_number = request.args.get('page', 1, type=int)
-        if page_number < 1:
-            page_number = 1
-        
-        offset = (page_number - 1) * page_size
-        
-
-        cur = conn.cursor()
-
-        length_score_map = {length: score_for_length(length) for length in VALID_WORD_LENGTHS}
-        raw_length_params = request.args.getlist('length')
-        selected_lengths = []
-        if raw_length_params:
-            for raw_length in raw_length_params:
-                try:
-                    parsed_length = int(raw_length)
-                except (TypeError, ValueError):
-                    continue
-                if parsed_length in VALID_WORD_LENGTHS:
-                    selected_lengths.append(parsed_length)
-            selected_lengths = sorted(set(selected_lengths))
-        if not selected_lengths:
-
-            selected_lengths = VALID_WORD_LENGTHS.copy()
-        selected_scores = [length_score_map[length] for length in selected_lengths]
-
-        cur.execute("""
-            SELECT COUNT(DISTINCT board)
-            FROM board_words
-            WHERE value = ANY(%s);
-        """, (selected_scores,))
-        total_records = cur.fetchone()[0]
-        total_pages = min((total_records + page_size - 1) // page_size, 10)
-
-        cur.execute("""
-            SELECT board, SUM(value) AS total_value
-            FROM board_words
-            WHERE value = ANY(%s)
-            GROUP BY board
-            ORDER BY total_value DESC
-            LIMIT %s OFFSET %s;
-        """, (selected_scores, page_size, offset))
-        board_records = cur.fetchall()
-        cur.close()
-        conn.close()
-        
-        return render_template('records.html', 
-                            records=board_records,
-                            page_number=page_number,
-                            total_pages=total_pages,
-                            total_records=total_records,
-                            valid_word_lengths=VALID_WORD_LENGTHS,
-                            selected_lengths=selected_lengths,
-                            length_score_map=length_score_map)
+        return _render_records()
     except Exception as e:
         return render_template('records.html', 
                                records=[], 
@@ -93,49 +51,230 @@ def records():
                                selected_lengths=VALID_WORD_LENGTHS.copy(),
                                length_score_map={length: score_for_length(length) for length in VALID_WORD_LENGTHS})
 
+def _render_records():
+    page_number = request.args.get('page', 1, type=int)
+    if page_number < 1:
+        page_number = 1
+
+    length_score_map = {length: score_for_length(length) for length in VALID_WORD_LENGTHS}
+    raw_length_params = request.args.getlist('length')
+    selected_lengths = []
+    if raw_length_params:
+        for raw_length in raw_length_params:
+            try:
+                parsed_length = int(raw_length)
+            except (TypeError, ValueError):
+                continue
+            if parsed_length in VALID_WORD_LENGTHS:
+                selected_lengths.append(parsed_length)
+        selected_lengths = sorted(set(selected_lengths))
+    if not selected_lengths:
+
+        selected_lengths = VALID_WORD_LENGTHS.copy()
+
+    # Pages are addressed by the (score, board) of the row just before or
+    # after them instead of an OFFSET
+    after = _keyset_cursor('after')
+    before = _keyset_cursor('before') if after is None else None
+    if after is None and before is None:
+        page_number = 1
+
+    page = storage.leaderboard_page(selected_lengths, after=after, before=before)
+    board_records = page.records
+    total_records = page.total_records
+    total_pages = min((total_records + PAGE_SIZE - 1) // PAGE_SIZE, MAX_PAGES)
+
+    previous_url = next_url = None
+    if board_records and page_number > 1:
+        first_score, first_board = board_records[0][1], board_records[0][0]
+        previous_url = url_for('records', length=selected_lengths, page=page_number - 1,
+                               before_score=first_score, before_board=first_board)
+    if board_records and page_number < total_pages:
+        last_score, last_board = board_records[-1][1], board_records[-1][0]
+        next_url = url_for('records', length=selected_lengths, page=page_number + 1,
+                           after_score=last_score, after_board=last_board)
+
+    return render_template('records.html', 
+                        records=board_records,
+                        page_number=page_number,
+                        total_pages=total_pages,
+                        total_records=total_records,
+                        more_records=page.more_records,
+                        page_size=PAGE_SIZE,
+                        previous_url=previous_url,
+                        next_url=next_url,
+                        valid_word_lengths=VALID_WORD_LENGTHS,
+                        selected_lengths=selected_lengths,
+                        length_score_map=length_score_map)
+
+def _keyset_cursor(direction):
+    score = request.args.get(f'{direction}_score', type=int)
+    board = request.args.get(f'{direction}_board')
+    if score is None or board is None:
+        return None
+    return score, board
+
 @app.route('/', methods = ['GET', 'POST'])
 def index():
-    conn = psycopg2.connect(
-    host=host_string,
-    database="postgres",
-    user="wwang038",
-    password="Password0988",
-    port=5432
-)
     if request.method == 'POST':
         input_grid = request.form['input_grid']
-        results, total_score = web_solver(input_grid)
-        cur = conn.cursor()
+        # Boards that are already stored are served from the database with no
+        # DFS and no second insert
+        known = storage.is_known(input_grid)
+        stored = storage.stored_results(input_grid) if known else None
+        partial = False
+        if stored is not None:
+            results, total_score = stored
+        else:
+            solved = web_solve(input_grid, request.form.get('deadline_ms', type=float))
+            results, total_score, partial = solved.results, solved.total_score, solved.partial
         better_than_me_percentage = 0
-        if total_score != 0:
-            cur.execute('''
-            INSERT INTO board_values (board, value) VALUES (%s, %s) ON CONFLICT (board) DO NOTHING
-            ''', (input_grid, total_score))
-            cur.execute('''
-            SELECT COUNT(*) FROM board_values;
-            ''')
-            total_records = cur.fetchone()[0]
-            cur.execute('''
-            SELECT COUNT(*) FROM board_values WHERE value >= %s AND value != 0;
-                        ''', (total_score,))
-            better_than_me = cur.fetchone()[0]
-            denominator = max(total_records - 1, 1)
-            better_than_me_percentage = round(((total_records - better_than_me) / denominator) * 100, 2)
-            result_rows = [(input_grid, word, score) for word, score in results]
-            if result_rows:
-                execute_values(cur, '''
-                INSERT INTO board_words (board, word, value) 
-                VALUES %s ON CONFLICT (board, word) DO NOTHING
-                ''', result_rows)
-            conn.commit()
-        cur.close()
-        conn.close()
-        return render_template('index.html', results=results, total_score=total_score, submitted=True, better_than_me_percentage=better_than_me_percentage)
+        # A search cut off by the deadline is shown but not recorded
+        if total_score != 0 and not partial:
+            if not known:
+                # The board is solved either way; a backed-up writer only
+                # costs this submission its place in storage
+                try:
+                    board_writer.submit(input_grid, total_score, results)
+                except WriterBusy as e:
+                    print(f"Skipped recording board {input_grid}: {e}")
+            better_than_me_percentage = storage.percentile(input_grid, total_score)
+        return render_template('index.html', results=results, total_score=total_score, submitted=True, better_than_me_percentage=better_than_me_percentage, partial=partial)
         
     else:
         
         return render_template('index.html', results = [], submitted=False)
 
+# Compact solve result: totals and a per-length histogram for the whole
+# board, plus one page of words grouped by length. Scores are left out since
+# every word of a length scores score_for_length(length). Words are paged in
+# ranked order (longest first, then alphabetically); pass the returned
+# next_cursor back as cursor to get the following page. Solves go through the
+# shared solve cache, so paging through a board solves it once. deadline_ms
+# (capped at WEB_DEADLINE_MS) bounds the search; a cut-off search is flagged
+# with partial and cells_covered and is not cached.
+@app.route('/api/solve', methods = ['GET', 'POST'])
+def solve_api():
+    params = request.get_json(silent=True) or request.values
+    if not isinstance(params, Mapping):
+        return jsonify(error='expected a JSON object or form fields'), 400
+    grid = params.get('grid', '')
+    cursor = params.get('cursor') or None
+    if not isinstance(grid, str) or not (cursor is None or isinstance(cursor, str)):
+        return jsonify(error='grid and cursor must be strings'), 400
+    if not grid:
+        return jsonify(error='grid is required'), 400
+    try:
+        limit = min(max(int(params.get('limit', API_PAGE_SIZE)), 1), API_MAX_PAGE_SIZE)
+        deadline_ms = params.get('deadline_ms')
+        solved = web_solve(grid, None if deadline_ms is None else float(deadline_ms))
+        results, total_score = solved.results, solved.total_score
+    except (AttributeError, TypeError, ValueError) as e:
+        return jsonify(error=str(e)), 400
+
+    histogram = {}
+    for word, _ in results:
+        histogram[len(word)] = histogram.get(len(word), 0) + 1
+
+    start = 0
+    if cursor is not None:
+        start = bisect.bisect_right(results, (-len(cursor), cursor),
+                                    key=lambda result: (-len(result[0]), result[0]))
+    page = results[start:start + limit]
+    words = {}
+    for word, _ in page:
+        words.setdefault(len(word), []).append(word)
+    more = start + limit < len(results)
+
+    return jsonify(grid=grid,
+                   partial=solved.partial,
+                   cells_covered=solved.cells_covered,
+                   total_score=total_score,
+                   word_count=len(results),
+                   histogram=histogram,
+                   words=words,
+                   next_cursor=page[-1][0] if page and more else None)
+
+# Server-Sent Events for one board: a "words" event for each batch of newly
+# found words, carrying the running total, then a "done" event with the
+# final totals. The first words arrive after the first start cell has been
+# searched rather than after the whole board. The search gets at most
+# deadline_ms (capped at WEB_DEADLINE_MS); "done" says whether it was cut
+# short. Nothing is recorded in storage.
+@app.route('/api/solve/stream', methods = ['GET'])
+def solve_stream():
+    grid = request.args.get('grid', '')
+    deadline_ms = web_deadline_ms(request.args.get('deadline_ms', type=float))
+    try:
+        board = Board(grid)
+    except ValueError as e:
+        return jsonify(error=str(e)), 400
+    if not board.letters:
+        return jsonify(error='grid is required'), 400
+    solver = Solver(get_dictionary())
+
+    def event(name, data):
+        return f'event: {name}\ndata: {json.dumps(data)}\n\n'
+
+    def generate():
+        total_score = 0
+        word_count = 0
+        chunk = []
+        # The first word goes out on its own; after that words are batched
+        # until SSE_CHUNK_WORDS have piled up or SSE_CHUNK_SECONDS have passed
+        last_sent = 0.0
+        for word, score in solver.iter_words(board, deadline_ms=deadline_ms):
+            chunk.append((word, score))
+            total_score += score
+            now = time.monotonic()
+            if len(chunk) >= SSE_CHUNK_WORDS or now - last_sent >= SSE_CHUNK_SECONDS:
+                word_count += len(chunk)
+                yield event('words', {'words': chunk, 'total_score': total_score, 'word_count': word_count})
+                chunk = []
+                last_sent = now
+        if chunk:
+            word_count += len(chunk)
+            yield event('words', {'words': chunk, 'total_score': total_score, 'word_count': word_count})
+        yield event('done', {'total_score': total_score, 'word_count': word_count,
+                             'partial': solver.partial, 'cells_covered': solver.cells_covered})
+
+    return Response(stream_with_context(generate()), mimetype='text/event-stream',
+                    headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'})
+
+# One board per line of the request body, either a bare grid or a JSON
+# object with a "grid" key. Each board is solved with the shared dictionary
+# and written out as one JSON line as soon as it is done; the body is read a
+# line at a time, so memory stays flat however large the batch is. Each board
+# gets at most deadline_ms (capped at WEB_DEADLINE_MS) and is flagged partial
+# if it ran out. Nothing is recorded in storage.
+@app.route('/api/solve/batch', methods = ['POST'])
+def solve_batch():
+    solver = Solver(get_dictionary())
+    deadline_ms = web_deadline_ms(request.args.get('deadline_ms', type=float))
+    stream = request.stream
+
+    def generate():
+        for line_number, raw_line in enumerate(stream, 1):
+            line = raw_line.decode('utf-8', 'replace').strip()
+            if not line:
+                continue
+            try:
+                grid = json.loads(line)['grid'] if line.startswith('{') else line
+                results = solver.solve(Board(grid), deadline_ms=deadline_ms)
+            except (ValueError, KeyError, TypeError, AttributeError) as e:
+                yield json.dumps({'line': line_number, 'error': str(e)}) + '\n'
+                continue
+            yield json.dumps({
+                'line': line_number,
+                'grid': grid,
+                'partial': solver.partial,
+                'cells_covered': solver.cells_covered,
+                'total_score': sum(score for _, score in results),
+                'words': results,
+            }) + '\n'
+
+    return Response(stream_with_context(generate()), mimetype='application/x-ndjson')
+
 if __name__ == '__main__':
     import os
     port = int(os.environ.get('PORT', 8080))